@@ -0,0 +1,29 @@
+"""Hatch build hook that precompiles the bundled xindy modules into the wheel."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class ModuleSnapshotHook(BuildHookInterface):
+    """Write ``xindy/_modules/snapshots.pickle`` (see :mod:`xindy.dsl.snapshots`)."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        try:
+            from xindy.dsl.snapshots import write_module_snapshots
+        finally:
+            sys.path.pop(0)
+        self._tmpdir = tempfile.mkdtemp()
+        snapshot = write_module_snapshots(Path(self._tmpdir) / "snapshots.pickle")
+        build_data["force_include"][str(snapshot)] = "xindy/_modules/snapshots.pickle"
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
@@ -0,0 +1,47 @@
+"""Helpers shared by the on-disk caches (raw entries, compiled styles)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import tempfile
+import time
+
+
+def write_atomic(path: Path, payload: bytes) -> None:
+    """Write ``payload`` to ``path`` so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def prune_directory(directory: Path, suffix: str, *, max_bytes: int, max_age: float) -> None:
+    """Remove ``*suffix`` files older than ``max_age`` seconds, then the least recently
+    used ones until the remaining files total at most ``max_bytes``."""
+    if not directory.is_dir():
+        return
+    now = time.time()
+    survivors: list[tuple[float, int, Path]] = []
+    for candidate in directory.glob(f"*{suffix}"):
+        try:
+            stat = candidate.stat()
+        except OSError:
+            continue
+        if now - stat.st_mtime > max_age:
+            candidate.unlink(missing_ok=True)
+            continue
+        survivors.append((stat.st_mtime, stat.st_size, candidate))
+    total = sum(size for _, size, _ in survivors)
+    for _, size, candidate in sorted(survivors):
+        if total <= max_bytes:
+            break
+        candidate.unlink(missing_ok=True)
+        total -= size
+
+
+__all__ = ["prune_directory", "write_atomic"]
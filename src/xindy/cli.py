@@ -11,11 +11,13 @@ import sys
 import click
 
 from . import __version__
+from .dsl.cache import StyleCache
 from .dsl.interpreter import StyleError, StyleInterpreter
 from .dsl.sexpr import SExprSyntaxError
 from .index import build_index_entries
 from .markup import render_index
-from .raw.reader import load_raw_index, parse_raw_index
+from .raw.cache import RawIndexCache
+from .raw.reader import iter_raw_index, load_raw_index, parse_raw_index
 
 
 @click.command(
@@ -96,6 +98,31 @@ from .raw.reader import load_raw_index, parse_raw_index
     is_flag=True,
     help="Compatibility flag (try-run/skip checks; ignored with warning).",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Parse large raw files with N worker processes.",
+)
+@click.option(
+    "--raw-cache",
+    "raw_cache",
+    type=click.Path(file_okay=False, resolve_path=True, path_type=Path),
+    help="Cache parsed raw files in DIR and reuse them while their content is unchanged.",
+)
+@click.option(
+    "--style-cache",
+    "style_cache",
+    type=click.Path(file_okay=False, resolve_path=True, path_type=Path),
+    help="Cache interpreted styles in DIR and reuse them while no loaded file changes.",
+)
+@click.option(
+    "--aggregate",
+    is_flag=True,
+    help="Fold duplicate entries while reading, keeping memory proportional to distinct terms.",
+)
 @click.argument("raw")
 @click.pass_context
 def cli(
@@ -112,6 +139,10 @@ def cli(
     markup_trace: bool,
     interactive: bool,
     try_run: bool,
+    jobs: int,
+    raw_cache: Path | None,
+    style_cache: Path | None,
+    aggregate: bool,
 ) -> int:
     """Click entrypoint for the xindy CLI."""
     return _run_cli(
@@ -128,6 +159,10 @@ def cli(
         markup_trace=markup_trace,
         interactive=interactive,
         try_run=try_run,
+        jobs=jobs,
+        raw_cache=raw_cache,
+        style_cache=style_cache,
+        aggregate=aggregate,
     )
 
 
@@ -158,6 +193,10 @@ def _run_cli(
     markup_trace: bool,
     interactive: bool,
     try_run: bool,
+    jobs: int,
+    raw_cache: Path | None,
+    style_cache: Path | None,
+    aggregate: bool,
 ) -> int:
     raw_path = None if raw == "-" else Path(raw).resolve()
     if raw_path is not None and not raw_path.exists():
@@ -183,8 +222,11 @@ def _run_cli(
             sys.stderr.write(message + "\n")
 
     try:
-        interpreter = StyleInterpreter()
-        state = interpreter.load(style_path, extra_search_paths=search_paths)
+        if style_cache is not None:
+            state = StyleCache(style_cache).load(style_path, extra_search_paths=search_paths)
+        else:
+            interpreter = StyleInterpreter()
+            state = interpreter.load(style_path, extra_search_paths=search_paths)
         if markup_trace:
             state.markup_options.setdefault("trace", {})["enabled"] = True
         if interactive:
@@ -209,13 +251,22 @@ def _run_cli(
                 raise RuntimeError(
                     f"filter command failed ({filtered.returncode}): {filtered.stderr.decode(errors='ignore')}"
                 ) from None
-            raw_entries = parse_raw_index(filtered.stdout.decode(codepage))
+            raw_entries = parse_raw_index(filtered.stdout.decode(codepage), workers=jobs)
         elif raw_path is None:
             raw_text = sys.stdin.buffer.read().decode(codepage)
-            raw_entries = parse_raw_index(raw_text)
+            raw_entries = parse_raw_index(raw_text, workers=jobs)
+        elif raw_cache is not None:
+            raw_entries = RawIndexCache(raw_cache).load(raw_path, workers=jobs)
+        elif jobs > 1:
+            raw_entries = load_raw_index(raw_path, workers=jobs)
         else:
-            raw_entries = load_raw_index(raw_path)
-        index = build_index_entries(raw_entries, state)
+            raw_entries = iter_raw_index(raw_path)
+        index = build_index_entries(raw_entries, state, aggregate=aggregate)
+        for line in index.diagnostics.summary():
+            print(f"warning: {line}", file=sys.stderr)
+            if logfile:
+                # _log would write to stderr again without a log file
+                _log(f"warning: {line}")
         output_text = render_index(index, style_state=state)
     except (FileNotFoundError, StyleError, SExprSyntaxError) as exc:
         print(f"xindy error: {exc}", file=sys.stderr)
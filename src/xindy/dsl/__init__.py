@@ -1,5 +1,6 @@
 """Subpackage containing DSL helpers (S-expression parsing, xindy style eval)."""
 
+from .cache import StyleCache
 from .interpreter import StyleError, StyleInterpreter, StyleState
 from .sexpr import Keyword, SExpr, Symbol, loads, parse_many, parse_one
 
@@ -7,6 +8,7 @@ from .sexpr import Keyword, SExpr, Symbol, loads, parse_many, parse_one
 __all__ = [
     "Keyword",
     "SExpr",
+    "StyleCache",
     "StyleError",
     "StyleInterpreter",
     "StyleState",
@@ -0,0 +1,41 @@
+"""Command line tool to build or verify the bundled module snapshots."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+from pathlib import Path
+import sys
+
+from .snapshots import SNAPSHOT_PATH, verify_module_snapshots, write_module_snapshots
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m xindy.dsl.build_snapshots",
+        description="Build or verify the precompiled snapshots of the bundled modules.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Verify the snapshot file against the module sources instead of writing it.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=SNAPSHOT_PATH,
+        help="Snapshot file to write or check.",
+    )
+    args = parser.parse_args(argv)
+    if not args.check:
+        print(f"wrote {write_module_snapshots(args.output)}")
+        return 0
+    problems = verify_module_snapshots(args.output)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
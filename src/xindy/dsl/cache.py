@@ -0,0 +1,160 @@
+"""On-disk cache of interpreted xindy styles."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import contextlib
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import cache
+import hashlib
+import os
+from os import PathLike
+from pathlib import Path
+import pickle
+
+from .._cache import prune_directory, write_atomic
+from .interpreter import StyleInterpreter, StyleState
+
+
+# bump whenever the layout of a pickled class changes
+_MAGIC = b"XSC2"
+_SUFFIX = ".xdyc"
+
+
+@dataclass
+class StyleCache:
+    """Directory of pickled :class:`StyleState` objects.
+
+    An entry is looked up by the resolved style path, the module search paths and
+    the features the interpreter starts with. It is only used while every file
+    recorded in ``state.loaded_files`` still hashes to the value seen when it was
+    stored, so editing any required module invalidates it. Features switched on
+    by the style itself are covered by those hashes. The key also hashes the
+    sources of this package, so entries never outlive the code that pickled them,
+    and an entry whose objects lack a field is treated as a miss. Limits and
+    eviction follow :class:`xindy.raw.RawIndexCache`.
+    """
+
+    directory: Path
+    max_bytes: int = 64 * 1024 * 1024
+    max_age: float = 30 * 24 * 60 * 60
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+
+    def load(
+        self,
+        path: str | PathLike[str],
+        *,
+        extra_search_paths: Sequence[Path] | None = None,
+    ) -> StyleState:
+        """Return the state for ``path``, interpreting and storing it on a miss."""
+        interpreter = StyleInterpreter()
+        search_paths = [*interpreter.state.search_paths]
+        search_paths.extend(Path(p).resolve() for p in extra_search_paths or ())
+        entry_path = self._entry_path(Path(path).resolve(), search_paths, interpreter.state)
+        cached = self._read(entry_path)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        state = interpreter.load(path, extra_search_paths=extra_search_paths)
+        self._write(entry_path, state)
+        self.prune()
+        return state
+
+    def prune(self) -> None:
+        """Apply the age and size limits to the cache directory."""
+        prune_directory(self.directory, _SUFFIX, max_bytes=self.max_bytes, max_age=self.max_age)
+
+    def _entry_path(self, style: Path, search_paths: list[Path], state: StyleState) -> Path:
+        key = repr(
+            (
+                _package_digest(),
+                str(style),
+                [str(p) for p in search_paths],
+                sorted(state.features),
+            )
+        )
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=20).hexdigest()
+        return self.directory / f"{digest}{_SUFFIX}"
+
+    def _read(self, entry_path: Path) -> StyleState | None:
+        try:
+            blob = entry_path.read_bytes()
+        except OSError:
+            return None
+        if not blob.startswith(_MAGIC):
+            return None
+        try:
+            files, state = pickle.loads(blob[len(_MAGIC) :])
+        except Exception:
+            # written by an incompatible version, or truncated
+            return None
+        if not isinstance(state, StyleState) or not _fields_readable(state):
+            return None
+        for file_path, digest in files:
+            if _file_digest(file_path) != digest:
+                return None
+        # refresh the timestamp so eviction is least-recently-used
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+        return state
+
+    def _write(self, entry_path: Path, state: StyleState) -> None:
+        files = [(path, _file_digest(path)) for path in sorted(state.loaded_files)]
+        try:
+            payload = pickle.dumps((files, state), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # a matcher defined outside this package may not be picklable
+            return
+        write_atomic(entry_path, _MAGIC + payload)
+
+
+@cache
+def _package_digest() -> str:
+    """Hash of the Python sources of the ``xindy`` package."""
+    root = Path(__file__).resolve().parent.parent
+    digest = hashlib.blake2b(digest_size=20)
+    for source in sorted(root.rglob("*.py")):
+        digest.update(source.relative_to(root).as_posix().encode("utf-8"))
+        with contextlib.suppress(OSError):
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _fields_readable(state: StyleState) -> bool:
+    """Whether every dataclass field reachable from ``state`` can be read.
+
+    Objects pickled with an older class layout unpickle with unset slots, which
+    would otherwise only fail when the index is built.
+    """
+    pending: list[object] = [state]
+    seen: set[int] = set()
+    try:
+        while pending:
+            obj = pending.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if is_dataclass(obj) and not isinstance(obj, type):
+                pending.extend(getattr(obj, item.name) for item in fields(obj))
+            elif isinstance(obj, dict):
+                pending.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                pending.extend(obj)
+    except (AttributeError, TypeError):
+        return False
+    return True
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=20).hexdigest()
+    except OSError:
+        return None
+
+
+__all__ = ["StyleCache"]
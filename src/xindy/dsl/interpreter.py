@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import partial
 from importlib import resources
 from pathlib import Path
 import re
@@ -25,7 +26,8 @@ from xindy.locref import (
     prefix_match_for_roman_numbers,
 )
 
-from .sexpr import Keyword, Symbol, parse_many
+from .sexpr import Keyword, SExpr, Symbol, parse_many
+from .snapshots import bundled_forms
 
 
 class StyleError(RuntimeError):
@@ -54,6 +56,13 @@ class StyleState:
     markup_options: dict[str, object] = field(default_factory=dict)
     features: set[str] = field(default_factory=set)
     crossref_classes: dict[str, bool] = field(default_factory=dict)
+    # Compiled sort/merge rules, built lazily by xindy.index.order.rule_pipeline.
+    rule_pipeline: object | None = field(default=None, repr=False, compare=False)
+    # Bound of the per-style sort key memo (xindy.index.order.sort_key_cache).
+    sort_key_cache_size: int | None = field(default=1 << 16, repr=False, compare=False)
+    sort_key_cache: object | None = field(default=None, repr=False, compare=False)
+    # Prefix trie of the letter groups (xindy.index.grouping.letter_group_classifier).
+    letter_group_classifier: object | None = field(default=None, repr=False, compare=False)
 
     def register_basetype(self, basetype: BaseType) -> None:
         self.basetypes[basetype.name] = basetype
@@ -106,21 +115,21 @@ class StyleInterpreter:
             Enumeration(
                 name="arabic-numbers",
                 base_alphabet=digits,
-                match_func=lambda text: prefix_match_for_radix_numbers(text, 10),
+                match_func=partial(prefix_match_for_radix_numbers, radix=10),
             )
         )
         self.state.register_basetype(
             Enumeration(
                 name="roman-numbers-uppercase",
                 base_alphabet=tuple("IVXLCDM"),
-                match_func=lambda text: prefix_match_for_roman_numbers(text, lowercase=False),
+                match_func=partial(prefix_match_for_roman_numbers, lowercase=False),
             )
         )
         self.state.register_basetype(
             Enumeration(
                 name="roman-numbers-lowercase",
                 base_alphabet=tuple("ivxlcdm"),
-                match_func=lambda text: prefix_match_for_roman_numbers(text, lowercase=True),
+                match_func=partial(prefix_match_for_roman_numbers, lowercase=True),
             )
         )
 
@@ -136,12 +145,9 @@ class StyleInterpreter:
         self.state.loaded_files.add(path)
         self._file_stack.append(path)
         try:
-            try:
-                content = path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                content = path.read_text(encoding="latin-1")
-            content = self._preprocess_content(content)
-            forms = parse_many(content)
+            forms = bundled_forms(path)
+            if forms is None:
+                forms = _parse_style_file(path)
             pending_feature: str | None = None
             for form in forms:
                 if pending_feature:
@@ -742,26 +748,7 @@ class StyleInterpreter:
         raise StyleError(f"Expected string-like value, got {value!r}")
 
     def _preprocess_content(self, content: str) -> str:
-        """Normalize legacy xindy string quirks before parsing."""
-        content = re.sub(r'"(\\\\?.)""(.)"', r'"\1\2"', content)
-        content = re.sub(r'"\\~"([A-Za-z])"', r'"\\~\1"', content)
-        content = re.sub(r'"(\\~)"([A-Za-z])"', r'"\1\2"', content)
-        content = re.sub(
-            r'\(merge-rule\s+"\\\"\s+""\s+:string\)',
-            r'(merge-rule "\\\\\"" "" :string)',
-            content,
-        )
-        content = re.sub(r'"(\\~)"\{\}"', r'"\1{}"', content)
-        content = re.sub(r'"(\\~)"\\([A-Za-z])"', r'"\1\\\2"', content)
-        # Concatenate adjacent string literals which xindy modules use heavily.
-        # Anchor to a token boundary so we don't eat closing quotes (e.g. ':close ""').
-        string_pair = re.compile(r'(^|[\\s(])"((?:\\.|[^"\\])*)""((?:\\.|[^"\\])*)"')
-        while True:
-            updated = string_pair.sub(lambda m: f'{m.group(1)}"{m.group(2)}{m.group(3)}"', content)
-            if updated == content:
-                break
-            content = updated
-        return content
+        return _preprocess_content(content)
 
     # ------------------------------------------------------------------ definition helpers
 
@@ -787,7 +774,11 @@ class StyleInterpreter:
         name: str,
         spec: object,
     ):
-        """Best-effort extraction of matcher (radix/roman) from a Lisp-ish form."""
+        """Best-effort extraction of matcher (radix/roman) from a Lisp-ish form.
+
+        Matchers are :func:`functools.partial` objects over module-level functions so
+        that a loaded :class:`StyleState` stays picklable.
+        """
 
         def find_radix(expr: object) -> int | None:
             if isinstance(expr, list):
@@ -806,14 +797,14 @@ class StyleInterpreter:
 
         radix = find_radix(spec)
         if radix is not None:
-            return lambda text, r=radix: prefix_match_for_radix_numbers(text, r)
+            return partial(prefix_match_for_radix_numbers, radix=radix)
 
         lower = "lower" in name or "lowercase" in name
         if "roman-numbers" in name or "roman" in name:
-            return lambda text, low=lower: prefix_match_for_roman_numbers(text, lowercase=low)
+            return partial(prefix_match_for_roman_numbers, lowercase=lower)
 
         if "arabic" in name:
-            return lambda text: prefix_match_for_radix_numbers(text, 10)
+            return partial(prefix_match_for_radix_numbers, radix=10)
 
         return None
 
@@ -844,4 +835,36 @@ class StyleInterpreter:
                 catattr.last_in_group = last_name
 
 
+def _parse_style_file(path: Path) -> list[SExpr]:
+    """Read and parse the .xdy file at ``path`` (UTF-8, falling back to latin-1)."""
+    try:
+        content = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        content = path.read_text(encoding="latin-1")
+    return parse_many(_preprocess_content(content))
+
+
+def _preprocess_content(content: str) -> str:
+    """Normalize legacy xindy string quirks before parsing."""
+    content = re.sub(r'"(\\\\?.)""(.)"', r'"\1\2"', content)
+    content = re.sub(r'"\\~"([A-Za-z])"', r'"\\~\1"', content)
+    content = re.sub(r'"(\\~)"([A-Za-z])"', r'"\1\2"', content)
+    content = re.sub(
+        r'\(merge-rule\s+"\\\"\s+""\s+:string\)',
+        r'(merge-rule "\\\\\"" "" :string)',
+        content,
+    )
+    content = re.sub(r'"(\\~)"\{\}"', r'"\1{}"', content)
+    content = re.sub(r'"(\\~)"\\([A-Za-z])"', r'"\1\\\2"', content)
+    # Concatenate adjacent string literals which xindy modules use heavily.
+    # Anchor to a token boundary so we don't eat closing quotes (e.g. ':close ""').
+    string_pair = re.compile(r'(^|[\\s(])"((?:\\.|[^"\\])*)""((?:\\.|[^"\\])*)"')
+    while True:
+        updated = string_pair.sub(lambda m: f'{m.group(1)}"{m.group(2)}{m.group(3)}"', content)
+        if updated == content:
+            break
+        content = updated
+    return content
+
+
 __all__ = ["StyleError", "StyleInterpreter", "StyleState"]
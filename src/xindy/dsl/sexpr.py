@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from io import TextIOBase
+import re
 from typing import Union
 
 
@@ -30,77 +31,109 @@ class Keyword(Symbol):
     """Representation of a Lisp keyword (prefixed with ':')."""
 
 
-class _Scanner:
-    """Incremental scanner with basic location tracking."""
+_QUOTE = Symbol("quote")
+_ESCAPES = {'"': '"', "\\": "\\"}
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_BLOCK_DELIMITER_RE = re.compile(r"#\||\|#")
+# Every match consumes leading whitespace/line comments plus exactly one token, so
+# consecutive matches tile the input and ``finditer`` never skips characters. The
+# group name drives dispatch in the parser loop; block comments must win over atoms.
+_TOKEN_RE = re.compile(
+    r"\s*(?:;[^\n]*\s*)*"
+    r"(?:(?P<block>#\|)"
+    r"|(?P<open>\()"
+    r"|(?P<close>\))"
+    r"|(?P<quote>')"
+    r'|"(?P<string>[^"\\]*(?:\\.[^"\\]*)*)"'
+    r'|(?P<atom>[^\s();"]+)'
+    r'|(?P<unterminated>")'
+    r"|\Z)",
+    re.DOTALL,
+)
+_UNTERMINATED_ESCAPE_RE = re.compile(r'"(?:[^"\\]|\\.)*\\\Z', re.DOTALL)
+
+
+class _Tokenizer:
+    """Token-at-a-time parser driven by a single compiled regular expression.
+
+    Whole tokens are matched in one step; line and column numbers are only
+    computed from the character offset when a syntax error is reported.
+    """
 
     def __init__(self, text: str):
         self._text = text
-        self._length = len(text)
-        self._index = 0
-        self._line = 1
-        self._column = 1
-
-    def eof(self) -> bool:
-        return self._index >= self._length
-
-    def peek(self) -> str | None:
-        return None if self.eof() else self._text[self._index]
-
-    def peek_next(self) -> str | None:
-        nxt = self._index + 1
-        return None if nxt >= self._length else self._text[nxt]
-
-    def advance(self) -> str:
-        if self.eof():
-            raise SExprSyntaxError("Unexpected EOF")
-        ch = self._text[self._index]
-        self._index += 1
-        if ch == "\n":
-            self._line += 1
-            self._column = 1
-        else:
-            self._column += 1
-        return ch
-
-    def error(self, message: str) -> SExprSyntaxError:
-        location = f"line {self._line}, column {self._column}"
-        return SExprSyntaxError(f"{message} at {location}")
-
-    def skip_separators(self) -> None:
-        while not self.eof():
-            ch = self.peek()
-            if ch is None:
-                return
-            if ch.isspace():
-                self.advance()
-                continue
-            if ch == ";":  # line comment
-                self._skip_line_comment()
-                continue
-            if ch == "#" and self.peek_next() == "|":
-                self._skip_block_comment()
-                continue
-            break
-
-    def _skip_line_comment(self) -> None:
-        while not self.eof() and self.advance() != "\n":
-            continue
-
-    def _skip_block_comment(self) -> None:
-        # consume "#|"
-        self.advance()
-        self.advance()
+        self._atoms: dict[str, SExprAtom] = {}
+
+    def error(self, message: str, offset: int) -> SExprSyntaxError:
+        line = self._text.count("\n", 0, offset) + 1
+        column = offset - self._text.rfind("\n", 0, offset)
+        return SExprSyntaxError(f"{message} at line {line}, column {column}")
+
+    def parse(self) -> list[SExpr]:
+        text = self._text
+        atoms = self._atoms
+        expressions: list[SExpr] = []
+        # Each frame is an open list, or ``None`` for a pending quote.
+        stack: list[list[SExpr] | None] = []
+        pos = 0
+        while pos is not None:
+            resume: int | None = None
+            for token in _TOKEN_RE.finditer(text, pos):
+                kind = token.lastgroup
+                if kind == "string":
+                    value: SExpr = unescape_string(token.group("string"))
+                elif kind == "atom":
+                    atom = token.group("atom")
+                    value = atoms.get(atom)
+                    if value is None:
+                        value = atoms[atom] = _convert_atom(atom)
+                elif kind == "open":
+                    stack.append([])
+                    continue
+                elif kind == "close":
+                    if not stack or stack[-1] is None:
+                        raise self.error("Unexpected ')'", token.start("close"))
+                    value = stack.pop()
+                elif kind == "quote":
+                    stack.append(None)
+                    continue
+                elif kind == "block":
+                    # Nested block comments need a counter, so restart the scan after it.
+                    resume = self._skip_block_comment(token.end())
+                    break
+                elif kind == "unterminated":
+                    raise self._string_error(token.start("unterminated"))
+                else:
+                    break
+                while stack and stack[-1] is None:
+                    stack.pop()
+                    value = [_QUOTE, value]
+                if stack:
+                    stack[-1].append(value)
+                else:
+                    expressions.append(value)
+            pos = resume
+        if stack:
+            if stack[-1] is None:
+                raise self.error("Unexpected EOF while reading expression", len(text))
+            raise self.error("EOF while reading list", len(text))
+        return expressions
+
+    def _skip_block_comment(self, pos: int) -> int:
         depth = 1
+        search = _BLOCK_DELIMITER_RE.search
         while depth > 0:
-            if self.eof():
-                raise self.error("EOF while inside block comment")
-            ch = self.advance()
-            if ch == "#" and self.peek() == "|":
-                self.advance()
-                depth += 1
-            elif ch == "|" and self.peek() == "#":
-                self.advance()
-                depth -= 1
+            delimiter = search(self._text, pos)
+            if delimiter is None:
+                raise self.error("EOF while inside block comment", len(self._text))
+            depth += 1 if delimiter.group() == "#|" else -1
+            pos = delimiter.end()
+        return pos
+
+    def _string_error(self, pos: int) -> SExprSyntaxError:
+        if _UNTERMINATED_ESCAPE_RE.match(self._text, pos):
+            return self.error("EOF after escape character", len(self._text))
+        return self.error("EOF while reading string literal", len(self._text))
 
 
 def parse_many(source: str | bytes | TextIOBase) -> list[SExpr]:
@@ -111,14 +144,7 @@ def parse_many(source: str | bytes | TextIOBase) -> list[SExpr]:
         text = source.decode()
     else:
         text = str(source)
-    scanner = _Scanner(text)
-    expressions: list[SExpr] = []
-    while True:
-        scanner.skip_separators()
-        if scanner.eof():
-            break
-        expressions.append(_parse_expression(scanner))
-    return expressions
+    return _Tokenizer(text).parse()
 
 
 def loads(text: str) -> list[SExpr]:
@@ -136,73 +162,19 @@ def parse_one(source: str | bytes | TextIOBase) -> SExpr:
     return exprs[0]
 
 
-def _parse_expression(scanner: _Scanner) -> SExpr:
-    scanner.skip_separators()
-    token = scanner.peek()
-    if token is None:
-        raise scanner.error("Unexpected EOF while reading expression")
-    if token == "(":
-        return _parse_list(scanner)
-    if token == ")":
-        raise scanner.error("Unexpected ')'")
-    if token == '"':
-        return _parse_string(scanner)
-    if token == "'":
-        scanner.advance()
-        return [Symbol("quote"), _parse_expression(scanner)]
-    return _parse_atom(scanner)
-
-
-def _parse_list(scanner: _Scanner) -> list[SExpr]:
-    elements: list[SExpr] = []
-    scanner.advance()  # consume "("
-    while True:
-        scanner.skip_separators()
-        token = scanner.peek()
-        if token is None:
-            raise scanner.error("EOF while reading list")
-        if token == ")":
-            scanner.advance()
-            return elements
-        elements.append(_parse_expression(scanner))
-
-
-def _parse_string(scanner: _Scanner) -> str:
-    scanner.advance()  # opening quote
-    result: list[str] = []
-    while True:
-        if scanner.eof():
-            raise scanner.error("EOF while reading string literal")
-        ch = scanner.advance()
-        if ch == '"':
-            break
-        if ch == "\\":
-            if scanner.eof():
-                raise scanner.error("EOF after escape character")
-            escaped = scanner.advance()
-            escape_map = {
-                '"': '"',
-                "\\": "\\",
-            }
-            if escaped in escape_map:
-                result.append(escape_map[escaped])
-            else:
-                result.append("\\" + escaped)
-        else:
-            result.append(ch)
-    return "".join(result)
-
-
-def _parse_atom(scanner: _Scanner) -> SExprAtom:
-    token_chars: list[str] = []
-    while True:
-        ch = scanner.peek()
-        if ch is None or ch.isspace() or ch in '();"':
-            break
-        token_chars.append(scanner.advance())
-    if not token_chars:
-        raise scanner.error("Expected atom")
-    token = "".join(token_chars)
+def unescape_string(body: str) -> str:
+    """Decode the escapes of a string literal body (the text between the quotes)."""
+    if "\\" not in body:
+        return body
+    return _ESCAPE_RE.sub(_unescape, body)
+
+
+def _unescape(match: re.Match[str]) -> str:
+    escaped = match.group(1)
+    return _ESCAPES.get(escaped, match.group(0))
+
+
+def _convert_atom(token: str) -> SExprAtom:
     if token.startswith(":"):
         return Keyword(token[1:])
     try:
@@ -224,4 +196,5 @@ __all__ = [
     "loads",
     "parse_many",
     "parse_one",
+    "unescape_string",
 ]
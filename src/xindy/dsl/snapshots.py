@@ -0,0 +1,117 @@
+"""Precompiled parse trees of the bundled ``xindy/_modules`` styles.
+
+Wheels ship ``_modules/snapshots.pickle``, written at build time by
+:func:`write_module_snapshots`. It maps every bundled ``.xdy`` file to the hash of
+its source and its preprocessed, parsed forms, so requiring a bundled module does
+not run the S-expression parser. A snapshot is only used while the source hash
+still matches; source checkouts without the file simply parse as before.
+
+Run ``python -m xindy.dsl.build_snapshots`` to (re)generate the file and
+``python -m xindy.dsl.build_snapshots --check`` to verify it against the sources.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+import hashlib
+from pathlib import Path
+import pickle
+
+from .sexpr import SExpr
+
+
+MODULES_DIR = Path(__file__).resolve().parents[1] / "_modules"
+SNAPSHOT_PATH = MODULES_DIR / "snapshots.pickle"
+# Bump when the preprocessing or parser output changes shape.
+_FORMAT = 1
+
+
+def bundled_forms(path: Path) -> list[SExpr] | None:
+    """Return the snapshot forms for the bundled module at ``path``, if up to date."""
+    if not path.is_relative_to(MODULES_DIR):
+        return None
+    record = _load_snapshots(SNAPSHOT_PATH).get(path.relative_to(MODULES_DIR).as_posix())
+    if record is None:
+        return None
+    digest, blob = record
+    try:
+        if _digest(path.read_bytes()) != digest:
+            return None
+    except OSError:
+        return None
+    # unpickled per call: interpreters must never share (and mutate) the same lists
+    return pickle.loads(blob)
+
+
+def build_module_snapshots(modules_dir: Path = MODULES_DIR) -> dict[str, tuple[str, bytes]]:
+    """Parse every ``.xdy`` file below ``modules_dir`` into snapshot records."""
+    from .interpreter import _parse_style_file
+
+    records: dict[str, tuple[str, bytes]] = {}
+    for source in sorted(modules_dir.rglob("*.xdy")):
+        forms = _parse_style_file(source)
+        records[source.relative_to(modules_dir).as_posix()] = (
+            _digest(source.read_bytes()),
+            pickle.dumps(forms, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+    return records
+
+
+def write_module_snapshots(
+    output: Path = SNAPSHOT_PATH,
+    modules_dir: Path = MODULES_DIR,
+) -> Path:
+    """Write the snapshot file for ``modules_dir`` to ``output`` and return it."""
+    payload = {"format": _FORMAT, "modules": build_module_snapshots(modules_dir)}
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    _load_snapshots.cache_clear()
+    return output
+
+
+def verify_module_snapshots(
+    snapshot: Path = SNAPSHOT_PATH,
+    modules_dir: Path = MODULES_DIR,
+) -> list[str]:
+    """Compare ``snapshot`` with the sources; return a description of each mismatch."""
+    if not snapshot.exists():
+        return [f"{snapshot}: snapshot file is missing"]
+    stored = _load_snapshots.__wrapped__(snapshot)
+    if not stored:
+        return [f"{snapshot}: unreadable or written by another format version"]
+    problems: list[str] = []
+    for name, (digest, blob) in build_module_snapshots(modules_dir).items():
+        record = stored.pop(name, None)
+        if record is None:
+            problems.append(f"{name}: missing from snapshot")
+        elif record[0] != digest:
+            problems.append(f"{name}: source changed since the snapshot was built")
+        elif pickle.loads(record[1]) != pickle.loads(blob):
+            problems.append(f"{name}: parsed forms differ from the snapshot")
+    problems.extend(f"{name}: no longer present in {modules_dir}" for name in sorted(stored))
+    return problems
+
+
+@cache
+def _load_snapshots(snapshot: Path) -> dict[str, tuple[str, bytes]]:
+    try:
+        payload = pickle.loads(snapshot.read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("format") != _FORMAT:
+        return {}
+    return payload["modules"]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+__all__ = [
+    "MODULES_DIR",
+    "SNAPSHOT_PATH",
+    "build_module_snapshots",
+    "bundled_forms",
+    "verify_module_snapshots",
+    "write_module_snapshots",
+]
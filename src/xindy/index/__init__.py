@@ -1,14 +1,20 @@
 """Index construction helpers."""
 
 from .builder import IndexBuilderError, build_index_entries
+from .columns import LocrefColumns
+from .diagnostics import BuildDiagnostics
+from .intervals import IntervalSet
 from .models import Index, IndexEntry, IndexLetterGroup, IndexNode
 
 
 __all__ = [
+    "BuildDiagnostics",
     "Index",
     "IndexBuilderError",
     "IndexEntry",
     "IndexLetterGroup",
     "IndexNode",
+    "IntervalSet",
+    "LocrefColumns",
     "build_index_entries",
 ]
@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
+import hashlib
 import logging
 
 from xindy.dsl.interpreter import StyleState
-from xindy.index.order import apply_merge_rules
+from xindy.index.collation import strip_position
+from xindy.index.order import entry_sort_key, sort_key_cache
 from xindy.locref import (
     CategoryAttribute,
     LayeredLocationClass,
+    LocationClassDispatch,
+    LocationMatchCache,
     build_location_reference,
     make_category_attribute,
 )
 from xindy.raw.reader import RawIndexEntry
 
+from .diagnostics import BuildDiagnostics
 from .grouping import group_entries_by_letter
-from .models import Index, IndexEntry
+from .models import Index, IndexEntry, _locref_signature
 
 
 class IndexBuilderError(RuntimeError):
@@ -32,21 +37,99 @@ def build_index_entries(
     *,
     default_locclass: str | None = None,
     enable_ranges: bool = True,
+    aggregate: bool = False,
 ) -> Index:
-    """Convert raw entries into structured :class:`IndexEntry` objects."""
-    locclasses = _resolve_location_classes(style_state, default_locclass)
-    entries: list[IndexEntry] = []
+    """Convert raw entries into structured :class:`IndexEntry` objects.
+
+    With ``aggregate``, entries that end on the same index node are folded as
+    they are read (see :func:`_aggregate_entries`), so memory grows with the
+    number of distinct terms rather than with the number of raw entries. The
+    resulting index is the same.
+
+    Raw entries identical to an earlier one are dropped before any rule is
+    applied; the kept entry retains its raw position and the number of dropped
+    entries is reported as :attr:`Index.duplicates_dropped`. Dropped entries
+    are not counted in :attr:`Index.total_entries` or in the ``entry_count`` of
+    their letter group. Entries that cannot be converted are skipped and counted
+    in :attr:`Index.diagnostics` for the caller to report.
+    """
+    locclasses = LocationClassDispatch(_resolve_location_classes(style_state, default_locclass))
+    unique = _DuplicateFilter()
+    diagnostics = BuildDiagnostics()
+    converted = _iter_index_entries(
+        unique.filter(raw_entries), style_state, locclasses, diagnostics
+    )
+    if aggregate:
+        entries, total = _aggregate_entries(converted)
+    else:
+        entries = list(converted)
+        total = len(entries)
+    grouped = group_entries_by_letter(entries, style_state, enable_ranges=enable_ranges)
+    progress = _compute_progress_markers(total)
+    if unique.dropped:
+        logger.info("Dropped %d duplicate raw entries", unique.dropped)
+    return Index(
+        groups=grouped,
+        total_entries=total,
+        progress_markers=progress,
+        duplicates_dropped=unique.dropped,
+        diagnostics=diagnostics,
+    )
+
+
+class _DuplicateFilter:
+    """Drop raw entries equal to an earlier one, keeping the raw positions.
+
+    Only a 16-byte digest of each entry is remembered, so the filter does not
+    keep the strings of every raw entry alive while entries are streamed.
+    """
+
+    def __init__(self) -> None:
+        self.seen: set[bytes] = set()
+        self.dropped = 0
+
+    def filter(self, raw_entries: Iterable[RawIndexEntry]) -> Iterator[tuple[int, RawIndexEntry]]:
+        seen = self.seen
+        for idx, raw in enumerate(raw_entries):
+            extras = _freeze(raw.extras) if raw.extras else ()
+            signature = (raw.key, raw.display_key, raw.attr, raw.locref, extras)
+            digest = hashlib.blake2b(repr(signature).encode(), digest_size=16).digest()
+            if digest in seen:
+                self.dropped += 1
+                continue
+            seen.add(digest)
+            yield idx, raw
+
+
+def _freeze(value: object) -> object:
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _iter_index_entries(
+    raw_entries: Iterable[tuple[int, RawIndexEntry]],
+    style_state: StyleState,
+    locclasses: LocationClassDispatch,
+    diagnostics: BuildDiagnostics,
+) -> Iterator[IndexEntry]:
     first_display_for_canon: dict[tuple[str, ...], tuple[str, ...]] = {}
-    for idx, raw in enumerate(raw_entries):
+    memo = sort_key_cache(style_state)
+    merge = memo.merge
+    # page strings repeat heavily, and misses are retried for every merge-to target
+    match_cache = LocationMatchCache()
+    for idx, raw in raw_entries:
         target_attrs = _expand_attributes(raw.attr, style_state)
         xref_target = _parse_xref_target(raw.extras.get("xref"))
         if xref_target is not None:
             try:
                 xref_attr, xref_verified = _resolve_crossref_class(style_state, raw.attr)
             except IndexBuilderError as exc:
-                logger.warning("Skipping crossref entry %s: %s", raw.key, exc)
+                diagnostics.record("crossref-class", raw.key, str(exc))
                 continue
-            canonical_key = tuple(apply_merge_rules(part, style_state) for part in raw.key)
+            canonical_key = tuple(map(merge, raw.key))
             if canonical_key not in first_display_for_canon:
                 first_display_for_canon[canonical_key] = raw.display_key or raw.key
             entry = IndexEntry(
@@ -58,12 +141,13 @@ def build_index_entries(
                 xref_verified=xref_verified,
                 position=idx,
             )
-            entries.append(entry)
+            entry.sort_key = entry_sort_key(entry, memo)
+            yield entry
             continue
         if not target_attrs:
-            logger.warning("Skipping entry %s: no target attributes resolved", raw.key)
+            diagnostics.record("no-attribute", raw.key)
             continue
-        canonical_key = tuple(apply_merge_rules(part, style_state) for part in raw.key)
+        canonical_key = tuple(map(merge, raw.key))
         if canonical_key not in first_display_for_canon:
             first_display_for_canon[canonical_key] = raw.display_key or raw.key
         entry = IndexEntry(
@@ -74,24 +158,24 @@ def build_index_entries(
             position=idx,
         )
         if raw.locref is None:
-            logger.warning("Skipping entry %s: missing :locref", raw.key)
+            diagnostics.record("missing-locref", raw.key)
             continue
         base_locref = None
         for target_attr, is_merge, drop in target_attrs:
             resolved_attr, catattr = _resolve_attribute(style_state, target_attr)
             if catattr is None:
-                logger.warning("Skipping entry %s: no category attribute available", raw.key)
+                diagnostics.record("no-category-attribute", raw.key, target_attr)
                 base_locref = None
                 break
             locref = None
-            for loccls in locclasses:
-                locref = build_location_reference(loccls, raw.locref, catattr, resolved_attr)
+            for loccls in locclasses.candidates(raw.locref):
+                locref = build_location_reference(
+                    loccls, raw.locref, catattr, resolved_attr, match_cache
+                )
                 if locref:
                     break
             if not locref:
-                logger.warning(
-                    "Skipping entry %s: could not build locref for %r", raw.key, raw.locref
-                )
+                diagnostics.record("unmatched-locref", raw.key, raw.locref)
                 base_locref = None
                 break
             if "open-range" in raw.extras:
@@ -107,12 +191,56 @@ def build_index_entries(
                 locref.origin = base_locref
             entry.add_location_reference(locref)
         if base_locref is None and not entry.locrefs:
-            logger.warning("Skipping entry %s: no valid location references", raw.key)
+            # the failure was recorded when the attribute loop broke off
             continue
-        entries.append(entry)
-    grouped = group_entries_by_letter(entries, style_state, enable_ranges=enable_ranges)
-    progress = _compute_progress_markers(len(entries))
-    return Index(groups=grouped, total_entries=len(entries), progress_markers=progress)
+        entry.sort_key = entry_sort_key(entry, memo)
+        yield entry
+
+
+def _aggregate_entries(entries: Iterable[IndexEntry]) -> tuple[list[IndexEntry], int]:
+    """Fold entries that :func:`build_hierarchy` would merge into one node.
+
+    Entries are folded when they reach the same node key with the same sort
+    key apart from position, so the folded entry sorts where the first of them
+    did. Its locrefs are deduplicated like :meth:`IndexNode.add_locrefs` would
+    and its attribute is the first one set. Cross-reference entries are kept
+    as they are and sort after the folded entry. Returns the entries and the
+    number of entries read.
+    """
+    folded: dict[tuple[bytes, tuple[str, ...]], IndexEntry] = {}
+    signatures: dict[tuple[bytes, tuple[str, ...]], set[tuple[str, str | None, str | None]]] = {}
+    crossrefs: list[IndexEntry] = []
+    total = 0
+    for entry in entries:
+        total += 1
+        # build_hierarchy stops at the shorter of the display and canonical keys
+        node_key = entry.canonical_key[: len(entry.display_key)]
+        group = (strip_position(entry.sort_key), node_key)
+        target = folded.get(group)
+        if target is None:
+            target = folded[group] = IndexEntry(
+                key=entry.key,
+                display_key=entry.display_key,
+                canonical_key=entry.canonical_key,
+                attribute=entry.attribute,
+                position=entry.position,
+                sort_key=entry.sort_key,
+                occurrences=0,
+            )
+            signatures[group] = set()
+        elif not target.attribute and entry.attribute:
+            target.attribute = entry.attribute
+        if entry.xref_target:
+            crossrefs.append(entry)
+            continue
+        target.occurrences += 1
+        seen = signatures[group]
+        for ref in entry.locrefs:
+            signature = _locref_signature(ref)
+            if signature not in seen:
+                seen.add(signature)
+                target.add_location_reference(ref)
+    return list(folded.values()) + crossrefs, total
 
 
 def _resolve_location_class(
@@ -0,0 +1,58 @@
+"""Byte-string collation keys for index entries.
+
+A collation key packs the sort runs of an entry, its case-folded display key
+and its position into one ``bytes`` object whose byte order equals the order
+of the ``(runs, display, position)`` tuples it replaces, so sorting compares
+keys with a single ``memcmp``.
+
+Strings are UTF-8 encoded, which preserves code point order. ``0x00`` bytes
+are reserved for the framing below:
+
+* ``00 02`` encodes a NUL character inside a string;
+* ``00 01`` ends a string, so a string sorts before its extensions;
+* ``00 00`` ends a tuple of strings, so a tuple sorts before its extensions.
+
+The position follows as a :data:`POSITION_BYTES`-byte big-endian integer.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+
+POSITION_BYTES = 8
+
+_NUL = "\x00\x02"
+_END_STRING = "\x00\x01"
+_END_TUPLE = "\x00\x00"
+
+
+def encode_collation_key(runs: Iterable[str], display: Iterable[str], position: int = 0) -> bytes:
+    """Return the collation key of ``(tuple(runs), tuple(display), position)``."""
+    text = _frame(runs) + _frame(display)
+    return text.encode("utf-8", "surrogatepass") + position.to_bytes(POSITION_BYTES, "big")
+
+
+def strip_position(key: bytes) -> bytes:
+    """Return ``key`` without its position, so entries differing only there compare equal."""
+    return key[:-POSITION_BYTES]
+
+
+def first_sort_run(key: bytes) -> str:
+    """Return the first run string stored in ``key`` (empty when there is none)."""
+    text = strip_position(key).decode("utf-8", "surrogatepass")
+    end = text.find(_END_TUPLE)
+    string_end = text.find(_END_STRING, 0, end)
+    if string_end != -1:
+        end = string_end
+    return text[:end].replace(_NUL, "\x00")
+
+
+def _frame(parts: Iterable[str]) -> str:
+    escaped = [part.replace("\x00", _NUL) for part in parts]
+    if not escaped:
+        return _END_TUPLE
+    return _END_STRING.join(escaped) + _END_STRING + _END_TUPLE
+
+
+__all__ = ["POSITION_BYTES", "encode_collation_key", "first_sort_run", "strip_position"]
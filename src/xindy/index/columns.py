@@ -0,0 +1,106 @@
+"""Columnar storage for the location references of an index node."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from xindy.locref import LayeredLocationReference
+
+
+# codes of ``LocrefColumns.states``; other states behave like "normal"
+NORMAL, OPEN_RANGE, CLOSE_RANGE = 0, 1, 2
+_STATE_CODES = {"open-range": OPEN_RANGE, "close-range": CLOSE_RANGE}
+
+
+class LocrefColumns:
+    """Location references of a node stored column by column.
+
+    Row ``i`` describes ``refs[i]``. ``ordnums[i]`` is its page number, the
+    last ordinal number of the reference (or its string read as an integer),
+    valid only where ``has_ordnum[i]`` is set; it is an ``array('q')`` unless
+    a value does not fit in 64 bits. ``first_ordnums`` is the same for the
+    first ordinal number. ``attributes`` and ``states`` hold small codes into
+    ``attribute_names`` and the module-level state constants, ``prefixes``
+    the leading layers (equal tuples are shared) and ``strings`` the location
+    strings. Numbers are converted once here instead of on every comparison.
+    Use :meth:`IndexNode.locref_columns` to get the columns of a node;
+    :meth:`set_state` keeps a reference and its row in step.
+    """
+
+    __slots__ = (
+        "attribute_names",
+        "attributes",
+        "first_ordnums",
+        "has_first_ordnum",
+        "has_ordnum",
+        "ordnums",
+        "prefixes",
+        "refs",
+        "states",
+        "strings",
+        "virtual",
+    )
+
+    def __init__(self, refs: Sequence[LayeredLocationReference]):
+        self.refs = refs
+        self.strings = [ref.locref_string for ref in refs]
+        try:
+            # the common case: every reference has integer ordnums
+            self.ordnums = array("q", [ref.ordnums[-1] for ref in refs])
+            self.first_ordnums = array("q", [ref.ordnums[0] for ref in refs])
+            self.has_ordnum = self.has_first_ordnum = b"\x01" * len(refs)
+        except (IndexError, TypeError, OverflowError):
+            self._convert_ordnums()
+        codes: dict[str | None, int] = {}
+        self.attributes = array("H", [codes.setdefault(ref.attribute, len(codes)) for ref in refs])
+        self.attribute_names = list(codes)
+        self.states = array("B", [_STATE_CODES.get(ref.state, NORMAL) for ref in refs])
+        self.virtual = bytes([bool(ref.virtual) for ref in refs])
+        pool: dict[tuple[str, ...], tuple[str, ...]] = {}
+        prefixes = [ref.layers[:-1] for ref in refs]
+        self.prefixes = [pool.setdefault(prefix, prefix) for prefix in prefixes]
+
+    def _convert_ordnums(self) -> None:
+        pairs = [_ordnums_of(ref) for ref in self.refs]
+        self.has_ordnum = bytes([last is not None for last, _ in pairs])
+        self.has_first_ordnum = bytes([first is not None for _, first in pairs])
+        self.ordnums = _int_column([last or 0 for last, _ in pairs])
+        self.first_ordnums = _int_column([first or 0 for _, first in pairs])
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def ordnum(self, idx: int) -> int | None:
+        return self.ordnums[idx] if self.has_ordnum[idx] else None
+
+    def set_state(self, idx: int, state: str) -> None:
+        self.refs[idx].state = state
+        self.states[idx] = _STATE_CODES.get(state, NORMAL)
+
+
+def _ordnums_of(ref: LayeredLocationReference) -> tuple[int | None, int | None]:
+    ordnums = ref.ordnums
+    if ordnums:
+        try:
+            first = int(ordnums[0])
+        except (TypeError, ValueError):
+            first = None
+        try:
+            return int(ordnums[-1]), first
+        except (TypeError, ValueError):
+            return None, first
+    try:
+        return int(ref.locref_string), None
+    except (TypeError, ValueError):
+        return None, None
+
+
+def _int_column(values: list[int]) -> array | list[int]:
+    try:
+        return array("q", values)
+    except OverflowError:
+        return values
+
+
+__all__ = ["CLOSE_RANGE", "NORMAL", "OPEN_RANGE", "LocrefColumns"]
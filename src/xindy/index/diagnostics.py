@@ -0,0 +1,60 @@
+"""Counters for problems found while building an index."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+SKIP_REASONS = {
+    "crossref-class": "cross reference class could not be resolved",
+    "no-attribute": "no target attributes resolved",
+    "missing-locref": "missing :locref",
+    "no-category-attribute": "no category attribute available",
+    "unmatched-locref": "no location class matches the location reference",
+}
+
+
+@dataclass(slots=True)
+class BuildDiagnostics:
+    """Skip reasons counted per category, with the first few offending entries.
+
+    :func:`build_index_entries` records every problem here instead of logging
+    it, so malformed inputs cost a counter increment per entry; at most
+    ``max_samples`` entries are kept per category to illustrate the summary.
+    """
+
+    max_samples: int = 3
+    counts: dict[str, int] = field(default_factory=dict)
+    samples: dict[str, list[str]] = field(default_factory=dict)
+
+    def record(self, category: str, key: tuple[str, ...], detail: str | None = None) -> None:
+        count = self.counts.get(category, 0)
+        self.counts[category] = count + 1
+        if count < self.max_samples:
+            sample = "!".join(key)
+            if detail:
+                sample = f"{sample} ({detail})"
+            self.samples.setdefault(category, []).append(sample)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.counts)
+
+    def summary(self) -> list[str]:
+        """Return one line per category, in the order problems were first seen."""
+        lines: list[str] = []
+        for category, count in self.counts.items():
+            samples = self.samples.get(category, [])
+            examples = ", ".join(samples)
+            if count > len(samples):
+                examples += ", ..."
+            noun = "entry" if count == 1 else "entries"
+            reason = SKIP_REASONS.get(category, category)
+            lines.append(f"skipped {count} {noun}: {reason} (e.g. {examples})")
+        return lines
+
+
+__all__ = ["BuildDiagnostics", "SKIP_REASONS"]
@@ -3,13 +3,67 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
-import re
+import string
 
 from xindy.dsl.interpreter import StyleState
 
+from .collation import first_sort_run
 from .hierarchy import build_hierarchy
 from .models import IndexEntry, IndexLetterGroup
-from .order import apply_sort_rules, sort_entries
+from .order import sort_entries, sort_key_cache
+
+
+_ASCII_ALNUM = frozenset(string.ascii_letters + string.digits)
+# key of the group label stored on a trie node
+_LABEL = ""
+
+
+class LetterGroupClassifier:
+    """Prefix trie resolving the letter group of a sort string.
+
+    Labels are matched case-insensitively against the sort string stripped of
+    leading non-alphanumeric characters; the longest label wins and, among
+    labels that fold to the same text, the first one in group order. Strings
+    matching no label fall into the first group, or ``"#"`` without groups.
+    Use :func:`letter_group_classifier` to get the instance of a :class:`StyleState`.
+    """
+
+    def __init__(self, groups: Sequence[str]):
+        self.groups = tuple(groups)
+        self.fallback = self.groups[0] if self.groups else "#"
+        self._root: dict[str, dict] = {}
+        for label in self.groups:
+            node = self._root
+            for char in label.lower():
+                node = node.setdefault(char, {})
+            node.setdefault(_LABEL, label)
+
+    def classify(self, text: str) -> str:
+        folded = text.lower()
+        start = 0
+        while start < len(folded) and folded[start] not in _ASCII_ALNUM:
+            start += 1
+        normalized = folded[start:] or folded
+        node = self._root
+        label = node.get(_LABEL)
+        for char in normalized:
+            node = node.get(char)
+            if node is None:
+                break
+            label = node.get(_LABEL, label)
+        return self.fallback if label is None else label
+
+
+def letter_group_classifier(style_state: StyleState) -> LetterGroupClassifier:
+    """Return the :class:`LetterGroupClassifier` of ``style_state``, building it if needed.
+
+    The classifier is cached on the state and rebuilt when the letter groups change.
+    """
+    classifier = style_state.letter_group_classifier
+    groups = _resolve_letter_groups(style_state)
+    if classifier is None or classifier.groups != tuple(groups):
+        classifier = style_state.letter_group_classifier = LetterGroupClassifier(groups)
+    return classifier
 
 
 def group_entries_by_letter(
@@ -19,12 +73,12 @@ def group_entries_by_letter(
     enable_ranges: bool = True,
 ) -> list[IndexLetterGroup]:
     sorted_entries = sort_entries(entries, style_state)
-    groups = _resolve_letter_groups(style_state)
+    classifier = letter_group_classifier(style_state)
+    groups = classifier.groups
     buckets: dict[str, list[IndexEntry]] = {label: [] for label in groups}
     extra_labels: list[str] = []
-    fallback_label = groups[0] if groups else "#"
     for entry in sorted_entries:
-        label = _letter_label_for_entry(entry, groups, style_state)
+        label = classifier.classify(_letter_text(entry, style_state))
         if label not in buckets:
             buckets[label] = []
             extra_labels.append(label)
@@ -44,7 +98,7 @@ def group_entries_by_letter(
                 IndexLetterGroup(
                     label=label,
                     nodes=nodes,
-                    entry_count=len(entries),
+                    entry_count=_count_entries(entries),
                 )
             )
     if not result and sorted_entries:
@@ -55,14 +109,18 @@ def group_entries_by_letter(
         )
         result.append(
             IndexLetterGroup(
-                label=fallback_label,
+                label=classifier.fallback,
                 nodes=nodes,
-                entry_count=len(sorted_entries),
+                entry_count=_count_entries(sorted_entries),
             )
         )
     return result
 
 
+def _count_entries(entries: Iterable[IndexEntry]) -> int:
+    return sum(entry.occurrences for entry in entries)
+
+
 def _range_attrs(style_state: StyleState) -> list[str]:
     if style_state.attributes:
         return list(style_state.attributes.keys())
@@ -79,29 +137,20 @@ def _resolve_letter_groups(state: StyleState) -> list[str]:
     return []
 
 
-def _letter_label_for_entry(
-    entry: IndexEntry,
-    groups: Sequence[str],
-    style_state: StyleState,
-) -> str:
+def _letter_text(entry: IndexEntry, style_state: StyleState) -> str:
+    if entry.sort_key is not None and entry.key:
+        # the first sort run of the first merged key part
+        return first_sort_run(entry.sort_key)
     text = ""
     if getattr(entry, "canonical_key", None):
         text = entry.canonical_key[0] if entry.canonical_key else ""
     elif entry.key:
         text = entry.key[0]
     if style_state and text:
-        runs = apply_sort_rules(text, style_state)
+        runs = sort_key_cache(style_state).sort(text)
         if runs:
             text = runs[0]
-    normalized = re.sub(r"^[^0-9a-zA-Z]+", "", text.lower())
-    if not normalized:
-        normalized = text.lower()
-    # prefer longest matching group prefix
-    sorted_groups = sorted(groups, key=lambda g: (-len(g), groups.index(g)))
-    for label in sorted_groups:
-        if normalized.startswith(label.lower()):
-            return label
-    return groups[0] if groups else "#"
-
-
-__all__ = ["group_entries_by_letter"]
+    return text
+
+
+__all__ = ["LetterGroupClassifier", "group_entries_by_letter", "letter_group_classifier"]
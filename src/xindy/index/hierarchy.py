@@ -6,6 +6,8 @@ from collections.abc import Iterable, Sequence
 
 from xindy.locref import LayeredLocationReference
 
+from .columns import CLOSE_RANGE, NORMAL, OPEN_RANGE
+from .intervals import IntervalSet
 from .models import IndexEntry, IndexNode
 
 
@@ -15,21 +17,22 @@ def build_hierarchy(
     suppress_covered_ranges: bool = False,
     enable_ranges: bool = True,
 ) -> list[IndexNode]:
-    roots: list[IndexNode] = []
+    # the roots are the children of an unnamed top node
+    top = IndexNode(term="", key=())
     range_allowed = set(allowed_range_attrs or [])
     allow_all_ranges = not range_allowed
     for entry in entries:
         if not entry.key:
             continue
-        current_level = roots
+        parent = top
         prefix: list[str] = []
         canon_prefix: list[str] = []
         node: IndexNode | None = None
         for token, canon_token in zip(entry.display_key, entry.canonical_key, strict=False):
             prefix.append(token)
             canon_prefix.append(canon_token)
-            node = _find_or_create_node(current_level, token, tuple(canon_prefix))
-            current_level = node.children
+            node = _find_or_create_node(parent, token, tuple(canon_prefix))
+            parent = node
         if node:
             if entry.attribute and node.attribute is None:
                 node.attribute = entry.attribute
@@ -43,22 +46,21 @@ def build_hierarchy(
             node.add_locrefs(entry.locrefs)
             # defer range detection to final sweep
     if enable_ranges:
-        for node in roots:
+        for node in top.children:
             _finalize_ranges(node, range_allowed, allow_all_ranges, suppress_covered_ranges)
-    return roots
+    return top.children
 
 
 def _find_or_create_node(
-    nodes: list[IndexNode],
+    parent: IndexNode,
     term: str,
     key: tuple[str, ...],
 ) -> IndexNode:
-    for node in nodes:
-        if node.key == key:
-            return node
-    new_node = IndexNode(term=term, key=key)
-    nodes.append(new_node)
-    return new_node
+    node = parent.find_child(key)
+    if node is None:
+        node = IndexNode(term=term, key=key)
+        parent.add_child(node)
+    return node
 
 
 def _detect_numeric_ranges(
@@ -69,94 +71,90 @@ def _detect_numeric_ranges(
 ) -> set[LayeredLocationReference]:
     node.ranges.clear()
     range_refs: set[LayeredLocationReference] = set()
+    columns = node.locref_columns()
+    refs = columns.refs
+    ordnums = columns.ordnums
+    has_ordnum = columns.has_ordnum
+    states = columns.states
 
-    grouped: dict[
-        tuple[str | None, str, tuple[str, ...]],
-        list[LayeredLocationReference],
-    ] = {}
-    class_lookup: dict[tuple[str | None, str, tuple[str, ...]], LayeredLocationReference] = {}
-    for ref in node.locrefs:
-        prefix_layers: tuple[str, ...] = tuple(getattr(ref, "layers", ())[:-1])
-        key = (ref.attribute, getattr(ref.locclass, "name", ""), prefix_layers)
-        grouped.setdefault(key, []).append(ref)
+    # rows grouped by (attribute code, class name, leading layers)
+    grouped: dict[tuple[int, str, tuple[str, ...]], list[int]] = {}
+    class_lookup: dict[tuple[int, str, tuple[str, ...]], LayeredLocationReference] = {}
+    for idx, ref in enumerate(refs):
+        key = (columns.attributes[idx], getattr(ref.locclass, "name", ""), columns.prefixes[idx])
+        grouped.setdefault(key, []).append(idx)
         class_lookup[key] = ref.locclass
 
-    for key, refs in grouped.items():
-        attr, _, _ = key
+    for key, rows in grouped.items():
+        attr = columns.attribute_names[key[0]]
+        range_attr_allowed = allow_all or attr in allowed_range_attrs
         locclass = class_lookup[key]
         join_length = getattr(locclass, "join_length", 2)
         local_ranges: list[tuple[LayeredLocationReference, LayeredLocationReference]] = []
-        refs_sorted = sorted(
-            refs,
-            key=lambda r: (
-                _to_ordnum(r) if _to_ordnum(r) is not None else float("inf"),
-                r.locref_string,
-            ),
-        )
-        stack: list[LayeredLocationReference] = []
-        covered: set[int] = set()
-        remaining: list[LayeredLocationReference] = []
-        for ref in refs_sorted:
-            state = getattr(ref, "state", "normal")
-            if state == "open-range":
-                stack.append(ref)
+        stack: list[int] = []
+        covered = IntervalSet()
+        remaining: list[int] = []
+        # by number then string; rows without a number last, by string
+        rows.sort(key=columns.strings.__getitem__)
+        numbered = [idx for idx in rows if has_ordnum[idx]]
+        numbered.sort(key=ordnums.__getitem__)
+        if len(numbered) < len(rows):
+            numbered.extend(idx for idx in rows if not has_ordnum[idx])
+        for idx in numbered:
+            state = states[idx]
+            if state == OPEN_RANGE:
+                stack.append(idx)
                 continue
-            if state == "close-range":
+            if state == CLOSE_RANGE:
                 if stack:
                     start = stack.pop()
-                    start_num = _to_ordnum(start)
-                    end_num = _to_ordnum(ref)
                     if (
-                        start_num is not None
-                        and end_num is not None
-                        and (allow_all or attr in allowed_range_attrs)
-                        and abs(end_num - start_num) >= join_length
+                        has_ordnum[start]
+                        and has_ordnum[idx]
+                        and range_attr_allowed
+                        and abs(ordnums[idx] - ordnums[start]) >= join_length
                     ):
-                        local_ranges.append((start, ref))
-                        range_refs.update({start, ref})
-                        lower, upper = sorted((start_num, end_num))
-                        covered.update(range(lower, upper + 1))
+                        local_ranges.append((refs[start], refs[idx]))
+                        range_refs.update({refs[start], refs[idx]})
+                        covered.add(ordnums[start], ordnums[idx])
                         continue
-                    start.state = "normal"
-                    ref.state = "normal"
+                    columns.set_state(start, "normal")
+                    columns.set_state(idx, "normal")
                     remaining.append(start)
-                remaining.append(ref)
+                remaining.append(idx)
                 continue
-            remaining.append(ref)
+            remaining.append(idx)
         # unmatched opens are treated as normal references
         for leftover in stack:
-            leftover.state = "normal"
+            columns.set_state(leftover, "normal")
         remaining.extend(stack)
 
-        filtered: list[LayeredLocationReference] = []
-        for ref in remaining:
-            ordnum = _to_ordnum(ref)
-            if ordnum is not None and ordnum in covered:
-                continue
-            filtered.append(ref)
-
         numeric = [
-            (ref, _to_ordnum(ref))
-            for ref in filtered
-            if _to_ordnum(ref) is not None
-            and getattr(ref, "state", "normal") not in ("open-range", "close-range")
-            and (suppress_covered or not getattr(ref, "virtual", False))
+            idx
+            for idx in remaining
+            if has_ordnum[idx]
+            and ordnums[idx] not in covered
+            and states[idx] == NORMAL
+            and (suppress_covered or not columns.virtual[idx])
         ]
-        if numeric and (allow_all or attr in allowed_range_attrs):
-            numeric.sort(key=lambda item: item[1])
-            start_ref, start_val = numeric[0]
+        if numeric and range_attr_allowed:
+            numeric.sort(key=ordnums.__getitem__)
+            start_val = ordnums[numeric[0]]
             prev_val = start_val
-            run_refs: list[tuple[LayeredLocationReference, int | None]] = [(start_ref, start_val)]
-            for ref, value in numeric[1:]:
+            run_refs: list[tuple[LayeredLocationReference, int | None]] = [
+                (refs[numeric[0]], start_val)
+            ]
+            for idx in numeric[1:]:
+                value = ordnums[idx]
                 if value == prev_val:
-                    run_refs.append((ref, value))
+                    run_refs.append((refs[idx], value))
                     continue
                 if value == prev_val + 1:
-                    run_refs.append((ref, value))
+                    run_refs.append((refs[idx], value))
                     prev_val = value
                     continue
                 _emit_range_if_needed(run_refs, join_length, local_ranges, suppress_covered)
-                run_refs = [(ref, value)]
+                run_refs = [(refs[idx], value)]
                 prev_val = value
             _emit_range_if_needed(run_refs, join_length, local_ranges, suppress_covered)
 
@@ -245,11 +243,12 @@ def _apply_merge_filters(
                 if span:
                     low, high = span
                     attr_source = getattr(origin, "attribute", None)
-                    for candidate in node.locrefs:
-                        if candidate.attribute != attr_source:
+                    columns = node.locref_columns()
+                    for idx, candidate in enumerate(columns.refs):
+                        if candidate.attribute != attr_source or not columns.has_ordnum[idx]:
                             continue
-                        ordnum = _to_ordnum(candidate)
-                        if ordnum is not None and low <= ordnum <= high:
+                        ordnum = columns.ordnums[idx]
+                        if low <= ordnum <= high:
                             sources_to_drop.add(candidate)
                             dropped_claims.setdefault(attr_source, set()).add(str(ordnum))
                 sources_to_drop.add(origin)
@@ -266,7 +265,8 @@ def _apply_merge_filters(
         if ref in sources_to_drop:
             continue
         filtered_locrefs.append(ref)
-    node.locrefs = filtered_locrefs
+    if len(filtered_locrefs) != len(node.locrefs):
+        node.set_locrefs(filtered_locrefs)
 
     node.ranges = [
         (start, end)
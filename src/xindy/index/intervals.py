@@ -0,0 +1,54 @@
+"""Sorted sets of integer intervals."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+
+
+class IntervalSet:
+    """Set of integers stored as sorted, disjoint, inclusive intervals.
+
+    Used for page range coverage: adding the range 1-2000 stores one interval
+    instead of 2000 integers, and membership is a binary search. Overlapping
+    and adjacent intervals are merged on insertion.
+    """
+
+    __slots__ = ("_ends", "_starts")
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    def add(self, lower: int, upper: int) -> None:
+        """Add every integer from ``lower`` to ``upper`` inclusive (in either order)."""
+        if lower > upper:
+            lower, upper = upper, lower
+        starts, ends = self._starts, self._ends
+        # intervals touching [lower, upper] are starts[first:last]
+        first = bisect_left(ends, lower - 1)
+        last = bisect_right(starts, upper + 1)
+        if first < last:
+            lower = min(lower, starts[first])
+            upper = max(upper, ends[last - 1])
+        starts[first:last] = [lower]
+        ends[first:last] = [upper]
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int):
+            return False
+        idx = bisect_right(self._starts, value) - 1
+        return idx >= 0 and value <= self._ends[idx]
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the ``(lower, upper)`` intervals in ascending order."""
+        return zip(self._starts, self._ends, strict=True)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)!r})"
+
+
+__all__ = ["IntervalSet"]
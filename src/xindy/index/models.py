@@ -7,6 +7,9 @@ from dataclasses import dataclass, field
 
 from xindy.locref import LayeredLocationReference
 
+from .columns import LocrefColumns
+from .diagnostics import BuildDiagnostics
+
 
 @dataclass(slots=True)
 class IndexEntry:
@@ -20,6 +23,9 @@ class IndexEntry:
     locrefs: list[LayeredLocationReference] = field(default_factory=list)
     xref_target: tuple[str, ...] | None = None
     xref_verified: bool = True
+    sort_key: bytes | None = None
+    # number of raw entries folded into this one by the aggregating builder
+    occurrences: int = 1
 
     def add_location_reference(self, locref: LayeredLocationReference) -> None:
         self.locrefs.append(locref)
@@ -46,25 +52,69 @@ class IndexNode:
     children: list[IndexNode] = field(default_factory=list)
     crossrefs: list[IndexCrossReference] = field(default_factory=list)
     dropped_ordnums: dict[str | None, set[str]] = field(default_factory=dict)
+    # key -> first child with that key, kept in step with ``children``
+    _children_by_key: dict[tuple[str, ...], IndexNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_children: int = field(default=0, init=False, repr=False, compare=False)
+    # signatures of ``locrefs`` used by add_locrefs to drop duplicates
+    _locref_signatures: set[tuple[str, str | None, str | None]] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    _signed_locrefs: int = field(default=0, init=False, repr=False, compare=False)
+    # columnar copy of ``locrefs`` built by locref_columns
+    _locref_columns: LocrefColumns | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_child(self, node: IndexNode) -> None:
         self.children.append(node)
+        if self._indexed_children == len(self.children) - 1:
+            self._children_by_key.setdefault(node.key, node)
+            self._indexed_children += 1
+
+    def find_child(self, key: tuple[str, ...]) -> IndexNode | None:
+        """Return the first child whose key is ``key``, in O(1)."""
+        if self._indexed_children != len(self.children):
+            # ``children`` grew or shrank outside add_child
+            self._children_by_key.clear()
+            for child in self.children:
+                self._children_by_key.setdefault(child.key, child)
+            self._indexed_children = len(self.children)
+        return self._children_by_key.get(key)
 
     def extend_locrefs(self, refs: list[LayeredLocationReference]) -> None:
         self.locrefs.extend(refs)
 
+    def set_locrefs(self, refs: list[LayeredLocationReference]) -> None:
+        """Replace the location references, keeping the dedup signatures in step."""
+        self.locrefs = refs
+        self._locref_signatures = {_locref_signature(ref) for ref in refs}
+        self._signed_locrefs = len(refs)
+        self._locref_columns = None
+
+    def locref_columns(self) -> LocrefColumns:
+        """Return :attr:`locrefs` as :class:`LocrefColumns`, rebuilt when they change."""
+        columns = self._locref_columns
+        if columns is None or columns.refs is not self.locrefs or len(columns) != len(self.locrefs):
+            columns = self._locref_columns = LocrefColumns(self.locrefs)
+        return columns
+
     def add_locrefs(self, refs: Iterable[LayeredLocationReference]) -> bool:
+        existing = self._locref_signatures
+        if self._signed_locrefs != len(self.locrefs):
+            # ``locrefs`` was changed without set_locrefs
+            existing.clear()
+            existing.update(_locref_signature(ref) for ref in self.locrefs)
         added = False
-        existing = {
-            (ref.locref_string, ref.attribute, getattr(ref, "state", None)) for ref in self.locrefs
-        }
         for ref in refs:
-            signature = (ref.locref_string, ref.attribute, getattr(ref, "state", None))
+            signature = _locref_signature(ref)
             if signature in existing:
                 continue
             self.locrefs.append(ref)
             existing.add(signature)
             added = True
+        self._signed_locrefs = len(self.locrefs)
         return added
 
     def add_crossref(
@@ -75,6 +125,10 @@ class IndexNode:
         )
 
 
+def _locref_signature(ref: LayeredLocationReference) -> tuple[str, str | None, str | None]:
+    return (ref.locref_string, ref.attribute, getattr(ref, "state", None))
+
+
 @dataclass(slots=True)
 class IndexLetterGroup:
     label: str
@@ -87,6 +141,9 @@ class Index:
     groups: list[IndexLetterGroup]
     total_entries: int
     progress_markers: list[int]
+    # raw entries dropped as exact duplicates of an earlier one
+    duplicates_dropped: int = 0
+    diagnostics: BuildDiagnostics = field(default_factory=BuildDiagnostics)
 
 
 __all__ = [
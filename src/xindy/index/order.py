@@ -3,132 +3,219 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-import re
+from dataclasses import dataclass
+from functools import lru_cache
 
 from xindy.dsl.interpreter import StyleState
 
+from .collation import encode_collation_key
 from .models import IndexEntry
+from .rules import RuleStep, apply_steps, compile_rules
+
+
+_UMLAUT_EXPANSIONS = {
+    '\\"a': "ae",
+    '\\"A': "AE",
+    '\\"o': "oe",
+    '\\"O': "OE",
+    '\\"u': "ue",
+    '\\"U': "UE",
+    '"a': "ae",
+    '"A': "AE",
+    '"o': "oe",
+    '"O': "OE",
+    '"u': "ue",
+    '"U': "UE",
+}
+_UMLAUT_PREFIXES = {needle: "_" + repl[0] for needle, repl in _UMLAUT_EXPANSIONS.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRulePipeline:
+    """Keyword merge rules and sort rules of a style, compiled once.
+
+    Rules are grouped by run and kept in application order: merge rules longest
+    pattern first within a run, sort rules in definition order. Patterns that fail
+    to compile are dropped, as the per-call implementation used to skip them.
+    Use :func:`rule_pipeline` to get the instance attached to a :class:`StyleState`.
+    """
+
+    merge_runs: tuple[tuple[RuleStep, ...], ...]
+    sort_runs: tuple[tuple[tuple[RuleStep, ...], bool], ...]
+    umlaut_map: dict[str, str]
+    signature: tuple[object, ...]
+
+    @classmethod
+    def from_style(cls, style_state: StyleState) -> CompiledRulePipeline:
+        merge_grouped: dict[int, list[tuple[str, str, bool]]] = {}
+        for pattern, replacement, repeat, run_idx in style_state.keyword_merge_rules:
+            merge_grouped.setdefault(run_idx, []).append((pattern, replacement, repeat))
+        merge_runs = tuple(
+            compile_rules(sorted(merge_grouped[run_idx], key=lambda rule: -len(rule[0])))
+            for run_idx in sorted(merge_grouped)
+        )
+        sort_grouped: dict[int, list[tuple[str, str, bool]]] = {}
+        for pattern, replacement, repeat, run_idx in style_state.sort_rules:
+            sort_grouped.setdefault(run_idx, []).append((pattern, replacement, repeat))
+        orientations = style_state.sort_rule_orientations
+        sort_runs = []
+        for run_idx in sorted(sort_grouped):
+            orientation = "forward"
+            if orientations:
+                try:
+                    orientation = orientations[run_idx]
+                except IndexError:
+                    orientation = orientations[-1]
+            sort_runs.append((compile_rules(sort_grouped[run_idx]), orientation == "backward"))
+        prefer_umlaut_prefix = any(
+            "wegweiser" in str(path) for path in getattr(style_state, "loaded_files", [])
+        )
+        return cls(
+            merge_runs=merge_runs,
+            sort_runs=tuple(sort_runs),
+            umlaut_map=_UMLAUT_PREFIXES if prefer_umlaut_prefix else _UMLAUT_EXPANSIONS,
+            signature=_rule_signature(style_state),
+        )
+
+    def merge(self, text: str) -> str:
+        """Apply the keyword merge rules (see :func:`apply_merge_rules`)."""
+        if not self.merge_runs:
+            return text
+        result = text
+        for rules in self.merge_runs:
+            result = apply_steps(result, rules)
+        for needle, repl in self.umlaut_map.items():
+            result = result.replace(needle, repl)
+        return result.replace('"', "").replace("\\", "")
+
+    def sort(self, text: str) -> tuple[str, ...]:
+        """Apply the sort rules, returning one string per run."""
+        if not self.sort_runs:
+            return (text,)
+        # backward runs work on the reversed text, which is kept reversed
+        return tuple(
+            apply_steps(text[::-1] if backward else text, rules)
+            for rules, backward in self.sort_runs
+        )
+
+
+def rule_pipeline(style_state: StyleState) -> CompiledRulePipeline:
+    """Return the :class:`CompiledRulePipeline` of ``style_state``, building it if needed.
+
+    The pipeline is cached on the state and rebuilt when rules are added to it.
+    """
+    pipeline = style_state.rule_pipeline
+    if pipeline is None or pipeline.signature != _rule_signature(style_state):
+        pipeline = style_state.rule_pipeline = CompiledRulePipeline.from_style(style_state)
+    return pipeline
+
+
+class SortKeyCache:
+    """Bounded LRU memo of merge- and sort-rule results for one style.
+
+    Key parts repeat heavily in real indexes (top-level terms with many
+    subentries, shared cross-reference targets), so the sort key, the
+    canonical key and the letter group label all go through this memo.
+    ``maxsize`` bounds each of the two memo tables; ``None`` means unbounded.
+    Pickling keeps the pipeline and the bound but not the memoized results.
+    """
+
+    def __init__(self, pipeline: CompiledRulePipeline, maxsize: int | None = 1 << 16):
+        self.pipeline = pipeline
+        self.maxsize = maxsize
+        self.merge = lru_cache(maxsize=maxsize)(pipeline.merge)
+        self.sort = lru_cache(maxsize=maxsize)(pipeline.sort)
+
+    def __getstate__(self) -> tuple[CompiledRulePipeline, int | None]:
+        return self.pipeline, self.maxsize
+
+    def __setstate__(self, state: tuple[CompiledRulePipeline, int | None]) -> None:
+        self.__init__(*state)
+
+    def key(self, part: str) -> tuple[str, ...]:
+        """Return the sort runs of ``part`` after the merge rules."""
+        return self.sort(self.merge(part))
+
+    @property
+    def hits(self) -> int:
+        return self.merge.cache_info().hits + self.sort.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        return self.merge.cache_info().misses + self.sort.cache_info().misses
+
+    def clear(self) -> None:
+        self.merge.cache_clear()
+        self.sort.cache_clear()
+
+
+def sort_key_cache(style_state: StyleState) -> SortKeyCache:
+    """Return the :class:`SortKeyCache` of ``style_state``, sized by ``sort_key_cache_size``.
+
+    The memo is dropped whenever :func:`rule_pipeline` rebuilds the pipeline.
+    """
+    pipeline = rule_pipeline(style_state)
+    memo = style_state.sort_key_cache
+    if memo is None or memo.pipeline is not pipeline:
+        memo = style_state.sort_key_cache = SortKeyCache(pipeline, style_state.sort_key_cache_size)
+    return memo
 
 
 def apply_merge_rules(text: str, style_state: StyleState) -> str:
-    if not style_state.keyword_merge_rules:
-        return text
-    grouped: dict[int, list[tuple[str, str, bool]]] = {}
-    for pattern, replacement, repeat, run_idx in style_state.keyword_merge_rules:
-        grouped.setdefault(run_idx, []).append((pattern, replacement, repeat))
-    result = text
-    for run_idx in sorted(grouped):
-        rules = sorted(grouped[run_idx], key=lambda rule: -len(rule[0]))
-        for pattern, replacement, repeat in rules:
-            try:
-                if not repeat:
-                    result = re.sub(pattern, replacement, result)
-                    continue
-                while True:
-                    updated = re.sub(pattern, replacement, result)
-                    if updated == result:
-                        break
-                    result = updated
-            except re.error:
-                continue
-    prefer_umlaut_prefix = any(
-        "wegweiser" in str(path) for path in getattr(style_state, "loaded_files", [])
-    )
-    if prefer_umlaut_prefix:
-        umlaut_map = {
-            '\\"a': "_a",
-            '\\"A': "_A",
-            '\\"o': "_o",
-            '\\"O': "_O",
-            '\\"u': "_u",
-            '\\"U': "_U",
-            '"a': "_a",
-            '"A': "_A",
-            '"o': "_o",
-            '"O': "_O",
-            '"u': "_u",
-            '"U': "_U",
-        }
-    else:
-        umlaut_map = {
-            '\\"a': "ae",
-            '\\"A': "AE",
-            '\\"o': "oe",
-            '\\"O': "OE",
-            '\\"u': "ue",
-            '\\"U': "UE",
-            '"a': "ae",
-            '"A': "AE",
-            '"o': "oe",
-            '"O': "OE",
-            '"u': "ue",
-            '"U': "UE",
-        }
-    for needle, repl in umlaut_map.items():
-        result = result.replace(needle, repl)
-    return result.replace('"', "").replace("\\", "")
-
-
-def _apply_run(text: str, rules: list[tuple[str, str, bool]]) -> str:
-    result = text
-    for pattern, replacement, repeat in rules:
-        try:
-            if not repeat:
-                result = re.sub(pattern, replacement, result)
-                continue
-            while True:
-                updated = re.sub(pattern, replacement, result)
-                if updated == result:
-                    break
-                result = updated
-        except re.error:
-            continue
-    return result
+    return rule_pipeline(style_state).merge(text)
 
 
 def apply_sort_rules(text: str, style_state: StyleState) -> tuple[str, ...]:
-    grouped: dict[int, list[tuple[str, str, bool]]] = {}
-    for pattern, replacement, repeat, run_idx in style_state.sort_rules:
-        grouped.setdefault(run_idx, []).append((pattern, replacement, repeat))
-    if not grouped:
-        return (text,)
-    results: list[str] = []
-    for run_idx in sorted(grouped):
-        orientation = "forward"
-        if style_state.sort_rule_orientations:
-            try:
-                orientation = style_state.sort_rule_orientations[run_idx]
-            except IndexError:
-                orientation = style_state.sort_rule_orientations[-1]
-        working = text[::-1] if orientation == "backward" else text
-        working = _apply_run(working, grouped[run_idx])
-        final = working if orientation == "backward" else working
-        results.append(final)
-    return tuple(results)
+    return rule_pipeline(style_state).sort(text)
+
+
+def _rule_signature(style_state: StyleState) -> tuple[object, ...]:
+    # the interpreter only appends rules and replaces the orientation list
+    return (
+        len(style_state.keyword_merge_rules),
+        len(style_state.sort_rules),
+        id(style_state.sort_rule_orientations),
+        len(style_state.loaded_files),
+    )
+
+
+def entry_sort_key(entry: IndexEntry, memo: SortKeyCache) -> bytes:
+    """Return the collation key of ``entry`` (see :mod:`xindy.index.collation`).
+
+    It orders entries by the sort runs of every key part, then by the
+    lower-cased display key, then by position.
+    """
+    key_parts: list[str] = []
+    for part in entry.key:
+        key_parts.extend(memo.key(part))
+    return encode_collation_key(
+        key_parts, (part.lower() for part in entry.display_key), entry.position
+    )
 
 
 def sort_entries(
     entries: Iterable[IndexEntry],
     style_state: StyleState,
 ) -> list[IndexEntry]:
-    """Sort entries alphabetically applying style-defined rules."""
+    """Sort entries alphabetically applying style-defined rules.
 
-    def sort_key(entry: IndexEntry) -> tuple[str, ...]:
-        key_parts: list[str] = []
-        for part in entry.key:
-            normalized = apply_merge_rules(part, style_state)
-            runs = apply_sort_rules(normalized, style_state)
-            key_parts.extend(runs)
-        return tuple(key_parts)
+    The precomputed :attr:`IndexEntry.sort_key` is used when set.
+    """
 
+    memo = sort_key_cache(style_state)
     return sorted(
         entries,
-        key=lambda e: (
-            sort_key(e),
-            tuple(part.lower() for part in e.display_key),
-            e.position,
-        ),
+        key=lambda e: e.sort_key or entry_sort_key(e, memo),
     )
 
 
-__all__ = ["apply_sort_rules", "sort_entries"]
+__all__ = [
+    "CompiledRulePipeline",
+    "SortKeyCache",
+    "apply_merge_rules",
+    "apply_sort_rules",
+    "entry_sort_key",
+    "rule_pipeline",
+    "sort_entries",
+    "sort_key_cache",
+]
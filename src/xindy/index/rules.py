@@ -0,0 +1,172 @@
+"""Compiled substitution steps for sort and merge rules.
+
+A run of rules is applied strictly in order, each rule rewriting the output of
+the previous ones. Literal rules (``:string`` rules and plain-text patterns) are
+merged into batches that are applied in one left-to-right pass, with
+:meth:`str.translate` when every pattern is a single character and a single
+alternation regex otherwise. A literal rule only joins a batch when the single
+pass provably gives the same result as the sequential substitutions:
+
+* its pattern shares no character with the replacement of an earlier rule in
+  the batch, so earlier output can never form a new match;
+* its pattern neither contains, is contained in, nor overlaps the pattern of
+  another batch member, so at most one rule can match at any position;
+* no earlier rule in the batch deletes text unless the pattern is a single
+  character, so a deletion cannot join two pieces into a new match.
+
+Rules that fail these checks start a new batch, and regular expressions keep
+their own ``re.sub`` step.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import re
+
+
+_REGEX_META = frozenset(".^$*+?{}[]|()")
+
+
+@dataclass(frozen=True, slots=True)
+class RegexRule:
+    """One regular-expression rule, optionally repeated until the text is stable."""
+
+    pattern: re.Pattern[str]
+    replacement: str
+    repeat: bool
+
+    def apply(self, text: str) -> str:
+        result = text
+        try:
+            if not self.repeat:
+                return self.pattern.sub(self.replacement, result)
+            while True:
+                updated = self.pattern.sub(self.replacement, result)
+                if updated == result:
+                    return result
+                result = updated
+        except re.error:
+            # invalid replacement template: the rule is skipped
+            return result
+
+
+@dataclass(frozen=True, slots=True)
+class LiteralBatch:
+    """Consecutive literal rules applied in a single pass (see module docstring)."""
+
+    replacements: dict[str, str]
+    pattern: re.Pattern[str] | None = None
+    table: dict[int, str] | None = None
+
+    @classmethod
+    def from_pairs(cls, pairs: dict[str, str]) -> LiteralBatch:
+        if all(len(needle) == 1 for needle in pairs):
+            table = {ord(needle): replacement for needle, replacement in pairs.items()}
+            return cls(replacements=pairs, table=table)
+        # with no overlapping patterns the alternation order does not matter
+        alternation = "|".join(re.escape(needle) for needle in pairs)
+        return cls(replacements=pairs, pattern=re.compile(alternation))
+
+    def apply(self, text: str) -> str:
+        if self.table is not None:
+            return text.translate(self.table)
+        return self.pattern.sub(self._lookup, text)
+
+    def _lookup(self, match: re.Match[str]) -> str:
+        return self.replacements[match.group()]
+
+
+RuleStep = RegexRule | LiteralBatch
+
+
+def compile_rules(rules: Iterable[tuple[str, str, bool]]) -> tuple[RuleStep, ...]:
+    """Compile ``(pattern, replacement, repeat)`` rules into ordered steps.
+
+    Patterns that fail to compile are dropped, matching how the rules were
+    skipped when applied one ``re.sub`` at a time.
+    """
+    steps: list[RuleStep] = []
+    batch: list[tuple[str, str]] = []
+
+    def flush() -> None:
+        if batch:
+            steps.append(LiteralBatch.from_pairs(dict(batch)))
+            batch.clear()
+
+    for pattern, replacement, repeat in rules:
+        needle = _literal_text(pattern)
+        if needle is not None and "\\" not in replacement:
+            if repeat and not _single_pass_is_fixpoint(needle, replacement):
+                flush()
+                steps.append(RegexRule(re.compile(pattern), replacement, repeat))
+                continue
+            if not all(_can_follow(needle, *earlier) for earlier in batch):
+                flush()
+            if any(needle == earlier for earlier, _ in batch):
+                # every occurrence was already rewritten by the earlier rule
+                continue
+            if not all(_disjoint(needle, earlier) for earlier, _ in batch):
+                flush()
+            batch.append((needle, replacement))
+            continue
+        flush()
+        try:
+            steps.append(RegexRule(re.compile(pattern), replacement, repeat))
+        except re.error:
+            continue
+    flush()
+    return tuple(steps)
+
+
+def apply_steps(text: str, steps: Iterable[RuleStep]) -> str:
+    for step in steps:
+        text = step.apply(text)
+    return text
+
+
+def _literal_text(pattern: str) -> str | None:
+    """Return the text matched by ``pattern`` if it is a plain literal, else ``None``."""
+    chars: list[str] = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char.isascii() and char.isalnum():
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in _REGEX_META:
+            return None
+        else:
+            chars.append(char)
+    if escaped or not chars:
+        return None
+    return "".join(chars)
+
+
+def _single_pass_is_fixpoint(needle: str, replacement: str) -> bool:
+    # repeating can only find new matches in the rule's own output or across a deletion
+    if set(needle) & set(replacement):
+        return False
+    return bool(replacement) or len(needle) == 1
+
+
+def _can_follow(needle: str, earlier_needle: str, earlier_replacement: str) -> bool:
+    if set(needle) & set(earlier_replacement):
+        return False
+    return bool(earlier_replacement) or len(needle) == 1
+
+
+def _disjoint(first: str, second: str) -> bool:
+    if first in second or second in first:
+        return False
+    shortest = min(len(first), len(second))
+    return not any(
+        first.endswith(second[:size]) or second.endswith(first[:size])
+        for size in range(1, shortest)
+    )
+
+
+__all__ = ["LiteralBatch", "RegexRule", "RuleStep", "apply_steps", "compile_rules"]
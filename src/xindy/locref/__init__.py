@@ -16,6 +16,8 @@ from .classes import (
     CrossrefLocationClass,
     LayeredLocationClass,
     LocationClass,
+    LocationClassDispatch,
+    LocationMatchCache,
     LocationMatchError,
     StandardLocationClass,
     VarLocationClass,
@@ -51,6 +53,8 @@ __all__ = [
     "LocClassLayer",
     "LocClassSeparator",
     "LocationClass",
+    "LocationClassDispatch",
+    "LocationMatchCache",
     "LocationMatchError",
     "LocationReference",
     "MatchResult",
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
 import re
+import string
+
+
+# Roman numerals up to this value are matched and converted with one dict lookup.
+ROMAN_TABLE_LIMIT = 4999
 
 
 @dataclass(slots=True)
@@ -38,23 +44,46 @@ class Alphabet(BaseType):
     """Concrete alphabet consisting of ordered string symbols."""
 
     symbols: tuple[str, ...] = ()
+    # prefix matcher built on first use by prefix_ordnums/prefix_match
+    _prefix_ordnums: dict[str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _prefix_regex: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not self.symbols:
             raise ValueError("alphabet requires at least one symbol")
         self.base_alphabet = calculate_base_alphabet(self.symbols)
 
+    def prefix_ordnums(self) -> dict[str, int]:
+        """Map every prefix of every symbol to its ordnum, longest prefixes first.
+
+        A text matches the longest prefix it shares with any symbol; the ordnum
+        is the position of the first symbol starting with that prefix.
+        """
+        if self._prefix_ordnums is None:
+            ordnums: dict[str, int] = {}
+            for ordinal, symbol in enumerate(self.symbols):
+                for size in range(1, len(symbol) + 1):
+                    ordnums.setdefault(symbol[:size], ordinal)
+            self._prefix_ordnums = {
+                prefix: ordnums[prefix] for prefix in sorted(ordnums, key=len, reverse=True)
+            }
+        return self._prefix_ordnums
+
     def prefix_match(self, text: str) -> MatchResult | None:
-        best: MatchResult | None = None
-        for ordinal, symbol in enumerate(self.symbols):
-            length = _common_prefix_length(text, symbol)
-            if length == 0:
-                continue
-            if not best or length > len(best.matched):
-                matched = text[:length]
-                rest = text[length:]
-                best = MatchResult(matched=matched, rest=rest, ordnum=ordinal)
-        return best
+        ordnums = self.prefix_ordnums()
+        if self._prefix_regex is None:
+            # an empty alternation would match the empty string
+            alternation = "|".join(map(re.escape, ordnums)) or "(?!)"
+            self._prefix_regex = re.compile(alternation)
+        found = self._prefix_regex.match(text)
+        if found is None:
+            return None
+        matched = found.group()
+        return MatchResult(matched=matched, rest=text[len(matched) :], ordnum=ordnums[matched])
 
 
 @dataclass(slots=True)
@@ -102,17 +131,16 @@ class LocClassSeparator:
 LayerElement = LocClassLayer | LocClassSeparator
 
 
-def _common_prefix_length(text: str, candidate: str) -> int:
-    max_len = min(len(text), len(candidate))
-    idx = 0
-    while idx < max_len and text[idx] == candidate[idx]:
-        idx += 1
-    # allow complete candidate match even if text has more chars
-    if idx == len(candidate):
-        return idx
-    if idx == len(text):
-        return idx
-    return idx
+@cache
+def radix_digits(radix: int) -> str:
+    """Return the digits of ``radix`` (2 to 36), letters in both cases."""
+    digits = (string.digits + string.ascii_lowercase)[:radix]
+    return digits + digits[10:].upper()
+
+
+@cache
+def _radix_digits_pattern(radix: int) -> re.Pattern[str]:
+    return re.compile(f"[{re.escape(radix_digits(radix))}]*")
 
 
 def prefix_match_for_radix_numbers(
@@ -120,6 +148,20 @@ def prefix_match_for_radix_numbers(
     radix: int,
 ) -> tuple[str, str, int | None]:
     """Return (matched, rest, numeric value) for the given radix."""
+    if not 2 <= radix <= 36:
+        return _prefix_match_digits(text, radix)
+    if radix == 10 and text.isascii() and text.isdigit():
+        # the whole text is one decimal number
+        return text, "", int(text)
+    end = _radix_digits_pattern(radix).match(text).end()
+    if end < len(text) and not text[end].isascii():
+        # int() also accepts non-ASCII digits
+        return _prefix_match_digits(text, radix)
+    matched = text[:end]
+    return matched, text[end:], int(matched, radix) if matched else None
+
+
+def _prefix_match_digits(text: str, radix: int) -> tuple[str, str, int | None]:
     digits = []
     value: int | None = None
     for char in text:
@@ -134,12 +176,57 @@ def prefix_match_for_radix_numbers(
     return matched, rest, value
 
 
-def _roman_to_int(roman: str) -> int | None:
-    mapping = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+_ROMAN_PATTERN = re.compile(r"^(m{0,4}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3}))")
+# hundreds, tens and units
+_ROMAN_DIGITS = tuple(
+    (
+        "",
+        one,
+        one * 2,
+        one * 3,
+        one + five,
+        five,
+        five + one,
+        five + one * 2,
+        five + one * 3,
+        one + ten,
+    )
+    for one, five, ten in (("c", "d", "m"), ("x", "l", "c"), ("i", "v", "x"))
+)
+_ROMAN_VALUES = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+
+
+@cache
+def roman_numeral_table(limit: int = ROMAN_TABLE_LIMIT) -> dict[str, int]:
+    """Map every lowercase roman numeral of 1 to ``limit`` to its value.
+
+    Only numerals that :func:`prefix_match_for_roman_numbers` matches in full
+    are included, so a table hit is the complete match.
+    """
+    table: dict[str, int] = {}
+    for value in range(1, min(limit, 4999) + 1):
+        numeral = (
+            "m" * (value // 1000)
+            + _ROMAN_DIGITS[0][value // 100 % 10]
+            + _ROMAN_DIGITS[1][value // 10 % 10]
+            + _ROMAN_DIGITS[2][value % 10]
+        )
+        found = _ROMAN_PATTERN.match(numeral)
+        if found and found.group(0) == numeral:
+            table[numeral] = value
+    return table
+
+
+def roman_numeral_value(roman: str) -> int | None:
+    """Return the value of an uppercase roman numeral, or ``None`` if it is not one."""
+    if roman.isupper():
+        value = roman_numeral_table(ROMAN_TABLE_LIMIT).get(roman.lower())
+        if value is not None:
+            return value
     total = 0
     prev = 0
     for char in roman:
-        value = mapping.get(char)
+        value = _ROMAN_VALUES.get(char)
         if value is None:
             return None
         if value > prev:
@@ -155,16 +242,15 @@ def prefix_match_for_roman_numbers(
     lowercase: bool = False,
 ) -> tuple[str, str, int | None]:
     """Return (matched, rest, numeric value) for roman numerals."""
-    pattern = r"^(m{0,4}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3}))"
-    if not lowercase:
-        match = re.match(pattern, text.upper())
-        matched = match.group(0) if match else ""
-        matched_original = text[: len(matched)]
-    else:
-        match = re.match(pattern, text.lower())
-        matched = match.group(0) if match else ""
-        matched_original = text[: len(matched)]
-    value = _roman_to_int(matched.upper()) if matched else None
+    folded = text.lower() if lowercase else text.upper()
+    value = roman_numeral_table(ROMAN_TABLE_LIMIT).get(folded)
+    if value is not None and len(folded) == len(text):
+        # the whole text is one numeral
+        return text, "", value
+    match = _ROMAN_PATTERN.match(folded)
+    matched = match.group(0) if match else ""
+    matched_original = text[: len(matched)]
+    value = roman_numeral_value(matched.upper()) if matched else None
     rest = text[len(matched_original) :]
     return matched_original, rest, value
 
@@ -177,7 +263,11 @@ __all__ = [
     "LocClassLayer",
     "LocClassSeparator",
     "MatchResult",
+    "ROMAN_TABLE_LIMIT",
     "calculate_base_alphabet",
     "prefix_match_for_radix_numbers",
     "prefix_match_for_roman_numbers",
+    "radix_digits",
+    "roman_numeral_table",
+    "roman_numeral_value",
 ]
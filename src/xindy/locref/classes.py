@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
+from functools import partial
+import re
 
-from .basetypes import LayerElement
+from .basetypes import (
+    Alphabet,
+    Enumeration,
+    LayerElement,
+    LocClassLayer,
+    LocClassSeparator,
+    prefix_match_for_radix_numbers,
+    prefix_match_for_roman_numbers,
+    radix_digits,
+    roman_numeral_value,
+)
 
 
 class LocationMatchError(ValueError):
@@ -34,6 +46,11 @@ class LocationClass:
 class LayeredLocationClass(LocationClass):
     layers: tuple[LayerElement, ...]
     hierdepth: int = 0
+    # CompiledLocationClass, or False when the layers cannot be compiled;
+    # filled on first use by compiled_location_class
+    compiled: CompiledLocationClass | bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
 @dataclass(slots=True)
@@ -74,11 +91,176 @@ def checked_make_var_location_class(
     return VarLocationClass(name=name, layers=tuple(layers), hierdepth=hierdepth)
 
 
+_ASCII = tuple(map(chr, range(128)))
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledLocationClass:
+    """A layered location class compiled into one anchored regular expression.
+
+    Each layer is a named group wrapped in an atomic lookahead, so a layer
+    consumes exactly what its ``prefix_match`` would and never backtracks into
+    a shorter match. ``converters`` turn the text of each layer into its ordnum.
+    The regex only reproduces the matchers for ASCII location strings.
+    """
+
+    pattern: re.Pattern[str]
+    converters: tuple[Callable[[str], int], ...]
+
+    def match(self, locstring: str) -> tuple[list[str], list[int]] | None:
+        found = self.pattern.match(locstring)
+        if found is None:
+            return None
+        layers = list(found.groups())
+        ordnums = [convert(text) for convert, text in zip(self.converters, layers, strict=True)]
+        return layers, ordnums
+
+
+def compile_location_class(locclass: LayeredLocationClass) -> CompiledLocationClass | None:
+    """Compile the layers of ``locclass``, or return ``None`` if a matcher is not known.
+
+    Separators, alphabets and the built-in radix and lowercase roman numeral
+    enumerations compile; other ``Enumeration.match_func`` callables do not.
+    """
+    parts: list[str] = []
+    converters: list[Callable[[str], int]] = []
+    for element in locclass.layers:
+        if isinstance(element, LocClassSeparator):
+            parts.append(re.escape(element.separator))
+            continue
+        if not isinstance(element, LocClassLayer):
+            return None
+        compiled = _compile_basetype(element.basetype)
+        if compiled is None:
+            return None
+        layer_pattern, converter = compiled
+        name = f"layer{len(converters)}"
+        parts.append(f"(?=(?P<{name}>{layer_pattern}))(?P={name})")
+        converters.append(converter)
+    return CompiledLocationClass(
+        pattern=re.compile("".join(parts) + r"\Z"), converters=tuple(converters)
+    )
+
+
+def compiled_location_class(locclass: LayeredLocationClass) -> CompiledLocationClass | None:
+    """Return the cached :func:`compile_location_class` result of ``locclass``."""
+    compiled = locclass.compiled
+    if compiled is None:
+        compiled = locclass.compiled = compile_location_class(locclass) or False
+    return compiled or None
+
+
+def first_characters(locclass: LayeredLocationClass) -> frozenset[str] | None:
+    """Return the ASCII characters a location string matching ``locclass`` can start with.
+
+    ``None`` means the first layer has a custom matcher that may accept anything.
+    Characters outside ASCII are not covered, as the built-in matchers accept
+    some of them (Unicode digits, case mappings).
+    """
+    if not locclass.layers:
+        return frozenset()
+    element = locclass.layers[0]
+    if isinstance(element, LocClassSeparator):
+        return frozenset(element.separator[:1]) if element.separator else None
+    if not isinstance(element, LocClassLayer):
+        return None
+    basetype = element.basetype
+    if isinstance(basetype, Alphabet):
+        return frozenset(symbol[0] for symbol in basetype.symbols if symbol)
+    builtin = _builtin_matcher(basetype)
+    if builtin is None:
+        return None
+    kind, argument = builtin
+    if kind == "radix":
+        return frozenset(radix_digits(argument))
+    # the roman matcher folds the text before matching it
+    fold = str.lower if argument else str.upper
+    return frozenset(char for char in _ASCII if fold(char) in "mdclxvi")
+
+
+class LocationClassDispatch:
+    """Location classes in priority order, narrowed by the first character of a string.
+
+    :meth:`candidates` drops the classes that cannot match a location string
+    starting with that character (see :func:`first_characters`), keeping the
+    order of the remaining ones.
+    """
+
+    def __init__(self, locclasses: Sequence[LayeredLocationClass]):
+        self.locclasses = tuple(locclasses)
+        self._first_characters = [first_characters(locclass) for locclass in self.locclasses]
+        self._by_character: dict[str, tuple[LayeredLocationClass, ...]] = {}
+
+    def candidates(self, locstring: str) -> tuple[LayeredLocationClass, ...]:
+        if not locstring or not locstring[0].isascii():
+            return self.locclasses
+        first = locstring[0]
+        found = self._by_character.get(first)
+        if found is None:
+            found = self._by_character[first] = tuple(
+                locclass
+                for locclass, starts in zip(self.locclasses, self._first_characters, strict=True)
+                if starts is None or first in starts
+            )
+        return found
+
+
+def _compile_basetype(basetype: object) -> tuple[str, Callable[[str], int]] | None:
+    if isinstance(basetype, Alphabet):
+        ordnums = basetype.prefix_ordnums()
+        if not ordnums:
+            return None
+        return "|".join(map(re.escape, ordnums)), ordnums.__getitem__
+    builtin = _builtin_matcher(basetype)
+    if builtin is None:
+        return None
+    kind, argument = builtin
+    if kind == "radix":
+        return f"[{re.escape(radix_digits(argument))}]+", partial(int, base=argument)
+    if argument:
+        # lowercase roman numerals are matched case-insensitively and are never empty
+        return (
+            "(?=[mdclxviMDCLXVI])(?i:m{0,4}(?:cm|cd|d?c{0,3})(?:xc|xl|l?x{0,3})(?:ix|iv|v?i{0,3}))",
+            _roman_ordnum,
+        )
+    return None
+
+
+def _builtin_matcher(basetype: object) -> tuple[str, int] | None:
+    """Identify the built-in enumeration matchers.
+
+    Returns ``("radix", radix)`` or ``("roman", lowercase)``, else ``None``.
+    """
+    if not isinstance(basetype, Enumeration):
+        return None
+    func = basetype.match_func
+    if not isinstance(func, partial) or func.args:
+        return None
+    if func.func is prefix_match_for_radix_numbers and set(func.keywords) == {"radix"}:
+        radix = func.keywords["radix"]
+        if isinstance(radix, int) and 2 <= radix <= 36:
+            return "radix", radix
+        return None
+    if func.func is prefix_match_for_roman_numbers and set(func.keywords) <= {"lowercase"}:
+        return "roman", bool(func.keywords.get("lowercase", False))
+    return None
+
+
+def _roman_ordnum(text: str) -> int:
+    return roman_numeral_value(text.upper()) or 0
+
+
 def perform_match(
     locstring: str,
     locclass: LayeredLocationClass,
 ) -> tuple[list[str], list[int]]:
     """Mimic LOCREF:perform-match returning matched layers and ordnums."""
+    compiled = compiled_location_class(locclass) if locstring.isascii() else None
+    if compiled is not None:
+        matched = compiled.match(locstring)
+        if matched is None:
+            raise LocationMatchError(f"could not match {locstring!r} against {locclass.name}")
+        return matched
     layer_matches: list[str] = []
     ordnums: list[int] = []
     rest = locstring
@@ -96,14 +278,54 @@ def perform_match(
     return layer_matches, ordnums
 
 
+class LocationMatchCache:
+    """Memo of :func:`perform_match` results, including misses.
+
+    Keyed by location class ordnum and location string, so one instance should
+    live no longer than the style it was filled from (typically one index build).
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[tuple[int, str], tuple[tuple[str, ...], tuple[int, ...]] | None] = {}
+
+    def match(
+        self,
+        locstring: str,
+        locclass: LayeredLocationClass,
+    ) -> tuple[tuple[str, ...], tuple[int, ...]] | None:
+        """Return the layers and ordnums of ``locstring``, or ``None`` if it does not match."""
+        key = (locclass.ordnum, locstring)
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+        try:
+            layers, ordnums = perform_match(locstring, locclass)
+        except LocationMatchError:
+            result = None
+        else:
+            result = (tuple(layers), tuple(ordnums))
+        self._results[key] = result
+        return result
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
 __all__ = [
+    "CompiledLocationClass",
     "CrossrefLocationClass",
     "LayeredLocationClass",
     "LocationClass",
+    "LocationClassDispatch",
+    "LocationMatchCache",
     "LocationMatchError",
     "StandardLocationClass",
     "VarLocationClass",
     "checked_make_standard_location_class",
     "checked_make_var_location_class",
+    "compile_location_class",
+    "compiled_location_class",
+    "first_characters",
     "perform_match",
 ]
@@ -5,7 +5,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 
-from .classes import LayeredLocationClass, LocationMatchError, perform_match
+from .classes import (
+    LayeredLocationClass,
+    LocationMatchCache,
+    LocationMatchError,
+    perform_match,
+)
 
 
 @dataclass(slots=True)
@@ -56,11 +61,18 @@ def build_location_reference(
     locref_str: str,
     category: CategoryAttribute,
     attribute: str | None,
+    match_cache: LocationMatchCache | None = None,
 ) -> LayeredLocationReference | None:
-    try:
-        layers, ordnums = perform_match(locref_str, locclass)
-    except LocationMatchError:
-        return None
+    if match_cache is not None:
+        matched = match_cache.match(locref_str, locclass)
+        if matched is None:
+            return None
+        layers, ordnums = matched
+    else:
+        try:
+            layers, ordnums = perform_match(locref_str, locclass)
+        except LocationMatchError:
+            return None
     return LayeredLocationReference(
         locclass=locclass,
         layers=tuple(layers),
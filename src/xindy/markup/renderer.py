@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from xindy.dsl.interpreter import StyleState
+from xindy.index.intervals import IntervalSet
 from xindy.index.models import Index, IndexNode
 
 
@@ -216,6 +217,31 @@ def _render_nodes(
         lines.append(close_template.format(depth=depth))
 
 
+class _ClaimedLocrefs:
+    """Locref strings already shown by an attribute group.
+
+    Pages covered by ranges are kept as integer intervals and match the locref
+    strings that spell them in decimal.
+    """
+
+    __slots__ = ("pages", "strings")
+
+    def __init__(self) -> None:
+        self.strings: set[str] = set()
+        self.pages = IntervalSet()
+
+    def __contains__(self, locref_string: str) -> bool:
+        if locref_string in self.strings:
+            return True
+        if not self.pages:
+            return False
+        try:
+            page = int(locref_string)
+        except (TypeError, ValueError):
+            return False
+        return str(page) == locref_string and page in self.pages
+
+
 def _render_locref_part(
     node: IndexNode,
     cfg: MarkupConfig,
@@ -225,12 +251,15 @@ def _render_locref_part(
 ) -> str:
     if not node.locrefs and not node.ranges:
         return ""
-    locrefs_by_key: dict[tuple[str, str | None], list[object]] = {}
+    # references are handled as rows of the node's columns
+    columns = node.locref_columns()
+    node_refs = columns.refs
+    rows_by_key: dict[tuple[str, str | None], list[int]] = {}
     locclass_map: dict[str, object] = {}
-    for ref in node.locrefs:
+    for row, ref in enumerate(node_refs):
         class_name = getattr(ref.locclass, "name", "")
         locclass_map[class_name] = ref.locclass
-        locrefs_by_key.setdefault((class_name, ref.attribute), []).append(ref)
+        rows_by_key.setdefault((class_name, ref.attribute), []).append(row)
     ranges_by_key: dict[tuple[str, str | None], list[tuple[object, object]]] = {}
     for start, end in node.ranges:
         class_name = getattr(start.locclass, "name", "")
@@ -251,14 +280,14 @@ def _render_locref_part(
             attr_order = [cat.name for cat in ordered_attrs]
 
     parts: list[
-        tuple[str | None, LocrefFormat, list[object], list[tuple[object, object]], object]
+        tuple[str | None, LocrefFormat, list[int], list[tuple[object, object]], object]
     ] = []
-    for (class_name, attr), refs in locrefs_by_key.items():
+    for (class_name, attr), rows in rows_by_key.items():
         class_ranges = ranges_by_key.get((class_name, attr), [])
         locclass = locclass_map.get(class_name)
         override_fmt = cfg.locref_formats.get(attr) if attr else None
         fmt_base = _merge_locfmt(locfmt, override_fmt)
-        parts.append((attr, fmt_base, refs, class_ranges, locclass))
+        parts.append((attr, fmt_base, rows, class_ranges, locclass))
     if not parts and node.ranges:
         for (class_name, attr), class_ranges in ranges_by_key.items():
             locclass = locclass_map.get(class_name)
@@ -271,15 +300,12 @@ def _render_locref_part(
 
     # order attributes if possible
     def sort_key(
-        item: tuple[str | None, LocrefFormat, list[object], list[tuple[object, object]], object],
+        item: tuple[str | None, LocrefFormat, list[int], list[tuple[object, object]], object],
     ) -> tuple[float, int]:
-        attr, _, refs, class_ranges, _ = item
-        ordnums: list[float] = []
-        for ref in refs:
-            try:
-                ordnums.append(float(ref.ordnums[0]))
-            except Exception:
-                continue
+        attr, _, rows, class_ranges, _ = item
+        ordnums: list[float] = [
+            columns.first_ordnums[row] for row in rows if columns.has_first_ordnum[row]
+        ]
         for start, _end in class_ranges:
             try:
                 ordnums.append(float(start.ordnums[0]))
@@ -310,31 +336,30 @@ def _render_locref_part(
         if attr not in priority:
             priority.append(attr)
     allowed_by_attr: dict[
-        str | None, tuple[list[object], list[tuple[object, object]], set[int]]
+        str | None, tuple[list[int], list[tuple[object, object]], IntervalSet]
     ] = {}
-    claimed_by_group: dict[int, set[str]] = {}
+    claimed_by_group: dict[int, _ClaimedLocrefs] = {}
     for attr in priority:
         segment = next((p for p in parts if p[0] == attr), None)
         group_id = attr_group_map.get(attr, -1)
-        claimed = claimed_by_group.setdefault(group_id, set())
+        claimed = claimed_by_group.setdefault(group_id, _ClaimedLocrefs())
         extra_claims = dropped_claims.get(attr)
         if extra_claims:
-            claimed.update(extra_claims)
+            claimed.strings.update(extra_claims)
         if not segment:
             claimed_by_group[group_id] = claimed
             continue
-        _, _, refs, class_ranges, _ = segment
-        filtered_refs = [r for r in refs if r.locref_string not in claimed]
-        unique_refs: list[object] = []
+        _, _, rows, class_ranges, _ = segment
+        filtered_rows: list[int] = []
         seen_strings: set[str] = set()
-        for r in filtered_refs:
-            if r.locref_string in seen_strings:
+        for row in rows:
+            locref_string = node_refs[row].locref_string
+            if locref_string in claimed or locref_string in seen_strings:
                 continue
-            seen_strings.add(r.locref_string)
-            unique_refs.append(r)
-        filtered_refs = unique_refs
+            seen_strings.add(locref_string)
+            filtered_rows.append(row)
         filtered_ranges = []
-        covered: set[int] = set()
+        covered = IntervalSet()
         for start, end in class_ranges:
             if start.locref_string in claimed or end.locref_string in claimed:
                 continue
@@ -343,17 +368,13 @@ def _render_locref_part(
             try:
                 s_ord = int(getattr(start, "ordnums", [None])[0])
                 e_ord = int(getattr(end, "ordnums", [None])[0])
-                if s_ord > e_ord:
-                    s_ord, e_ord = e_ord, s_ord
-                for val in range(s_ord, e_ord + 1):
-                    claimed.add(str(val))
-                    covered.add(val)
+                claimed.pages.add(s_ord, e_ord)
+                covered.add(s_ord, e_ord)
             except (TypeError, ValueError):
                 pass
-        for r in filtered_refs:
-            claimed.add(r.locref_string)
+        claimed.strings.update(seen_strings)
         claimed_by_group[group_id] = claimed
-        allowed_by_attr[attr] = (filtered_refs, filtered_ranges, covered)
+        allowed_by_attr[attr] = (filtered_rows, filtered_ranges, covered)
 
     dropped_claims = getattr(node, "dropped_ordnums", {}) if node else {}
     attr_order_map = {attr: idx for idx, attr in enumerate(priority)}
@@ -376,14 +397,16 @@ def _render_locref_part(
             if not segment:
                 continue
             fmt_base, class_ranges, locclass = segment
-            refs_filtered, ranges_filtered, covered = allowed_by_attr.get(attr, ([], [], set()))
+            rows_filtered, ranges_filtered, covered = allowed_by_attr.get(
+                attr, ([], [], IntervalSet())
+            )
             if separator is None:
                 separator = cfg.attr_group_sep or fmt_base.separator
             attr_idx = attr_order_map.get(attr, len(attr_order_map))
             hierdepth = getattr(locclass, "hierdepth", 0) or 0
             if hierdepth > 1:
                 content = _format_locrefs_for_class(
-                    refs_filtered,
+                    [node_refs[row] for row in rows_filtered],
                     ranges_filtered,
                     locclass,
                     cfg,
@@ -392,7 +415,7 @@ def _render_locref_part(
                     per_item_format,
                 )
                 if content:
-                    ord_candidates = [_loc_ordnum(ref) for ref in refs_filtered] + [
+                    ord_candidates = [columns.ordnum(row) for row in rows_filtered] + [
                         _loc_ordnum(start) for start, _ in ranges_filtered
                     ]
                     ord_candidates = [o for o in ord_candidates if o is not None]
@@ -408,8 +431,9 @@ def _render_locref_part(
                 range_fmt = _select_range_format(cfg, class_name, start, end)
                 text = _format_range_value(start, end, fmt_base, cfg, per_item_format, range_fmt)
                 attr_items.append((key, text))
-            for ref in refs_filtered:
-                ordnum = _loc_ordnum(ref)
+            for row in rows_filtered:
+                ref = node_refs[row]
+                ordnum = columns.ordnum(row)
                 if suppress_covered and covered and ordnum is not None and ordnum in covered:
                     continue
                 key = (ordnum if ordnum is not None else float("inf"), attr_idx, 0)
@@ -493,7 +517,7 @@ def _format_locrefs_for_class(
     refs = sorted(refs, key=ref_key)
     ranges = sorted(ranges, key=lambda pair: ref_key(pair[0]))
     if ranges and cfg.backend == "tex":
-        covered_ordnums: set[int] = set()
+        covered_ordnums = IntervalSet()
         for start, end in ranges:
             try:
                 start_num = int(getattr(start, "ordnums", [None])[0])
@@ -502,9 +526,7 @@ def _format_locrefs_for_class(
                 continue
             if start_num is None or end_num is None:
                 continue
-            if start_num > end_num:
-                start_num, end_num = end_num, start_num
-            covered_ordnums.update(range(start_num, end_num + 1))
+            covered_ordnums.add(start_num, end_num)
         if covered_ordnums:
             refs = [
                 ref
@@ -536,7 +558,7 @@ def _format_locrefs_for_class(
             except (TypeError, ValueError):
                 return float("inf")
 
-        covered: set[int] = set()
+        covered = IntervalSet()
         items: list[tuple[int | float, str]] = []
         for start, end in ranges:
             s = ord_or_inf(start)
@@ -545,7 +567,7 @@ def _format_locrefs_for_class(
                 continue
             if s > e:
                 s, e = e, s
-            covered.update(range(int(s), int(e) + 1))
+            covered.add(int(s), int(e))
             range_fmt = _select_range_format(cfg, class_name, start, end)
             items.append(
                 (
@@ -569,7 +591,7 @@ def _format_locrefs_for_class(
         joined = separator.join(val for _, val in items)
         return f"{fmt.prefix}{joined}"
     items: list[tuple[int | float, str]] = []
-    covered: set[int] = set()
+    covered = IntervalSet()
     for start, end in ranges:
         try:
             s = int(start.ordnums[0]) if start.ordnums else None
@@ -579,7 +601,7 @@ def _format_locrefs_for_class(
         if s is not None and e is not None:
             if s > e:
                 s, e = e, s
-            covered.update(range(s, e + 1))
+            covered.add(s, e)
             range_fmt = _select_range_format(cfg, class_name, start, end)
             items.append(
                 (
@@ -1,6 +1,20 @@
 """Utilities for working with raw index files."""
 
-from .reader import RawIndexEntry, load_raw_index, parse_raw_index
+from .cache import RawIndexCache
+from .reader import (
+    RawIndexEntry,
+    iter_raw_index,
+    load_raw_index,
+    load_raw_index_mmap,
+    parse_raw_index,
+)
 
 
-__all__ = ["RawIndexEntry", "load_raw_index", "parse_raw_index"]
+__all__ = [
+    "RawIndexCache",
+    "RawIndexEntry",
+    "iter_raw_index",
+    "load_raw_index",
+    "load_raw_index_mmap",
+    "parse_raw_index",
+]
@@ -0,0 +1,108 @@
+"""On-disk cache of parsed raw index entries."""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass, field
+import hashlib
+import marshal
+import os
+from os import PathLike
+from pathlib import Path
+import sys
+
+from .._cache import prune_directory, write_atomic
+from .reader import RawIndexEntry, parse_raw_index
+
+
+_MAGIC = b"XRC1"
+_SUFFIX = ".rawc"
+# marshal's format is tied to the interpreter version, so it is part of the header.
+_PYTHON_TAG = sys.implementation.cache_tag or f"py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+@dataclass
+class RawIndexCache:
+    """Directory of parsed ``.raw`` files, keyed by file size and content hash.
+
+    Modification times are deliberately not part of the key: LaTeX reruns rewrite
+    unchanged ``.raw`` files, which would otherwise always miss. Entries are stored
+    with :mod:`marshal`, so a hit never touches the S-expression parser. After every
+    store, entries older than ``max_age`` seconds are removed, then the least
+    recently used ones until the directory holds at most ``max_bytes``.
+    """
+
+    directory: Path
+    max_bytes: int = 256 * 1024 * 1024
+    max_age: float = 30 * 24 * 60 * 60
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+
+    def load(
+        self,
+        path: str | PathLike[str],
+        *,
+        workers: int | None = None,
+    ) -> list[RawIndexEntry]:
+        """Return the entries of ``path``, parsing and storing them on a miss."""
+        data = Path(path).read_bytes()
+        entry_path = self._entry_path(data)
+        cached = self._read(entry_path, len(data))
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = data.decode("latin-1")
+        entries = parse_raw_index(text, workers=workers)
+        self._write(entry_path, len(data), entries)
+        self.prune()
+        return entries
+
+    def prune(self) -> None:
+        """Apply the age and size limits to the cache directory."""
+        prune_directory(self.directory, _SUFFIX, max_bytes=self.max_bytes, max_age=self.max_age)
+
+    def _entry_path(self, data: bytes) -> Path:
+        digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+        return self.directory / f"{len(data):x}-{digest}{_SUFFIX}"
+
+    def _read(self, entry_path: Path, size: int) -> list[RawIndexEntry] | None:
+        try:
+            blob = entry_path.read_bytes()
+        except OSError:
+            return None
+        if not blob.startswith(_MAGIC):
+            return None
+        try:
+            tag, stored_size, rows = marshal.loads(blob[len(_MAGIC) :])
+            if tag != _PYTHON_TAG or stored_size != size:
+                return None
+            # rows follow the RawIndexEntry field order, see _write
+            entries = [RawIndexEntry(*row) for row in rows]
+        except (EOFError, TypeError, ValueError):
+            return None
+        # refresh the timestamp so eviction is least-recently-used
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+        return entries
+
+    def _write(self, entry_path: Path, size: int, entries: list[RawIndexEntry]) -> None:
+        rows = [
+            (entry.key, entry.locref, entry.display_key, entry.attr, dict(entry.extras))
+            for entry in entries
+        ]
+        try:
+            payload = marshal.dumps((_PYTHON_TAG, size, rows))
+        except ValueError:
+            # extras holding symbols cannot be marshalled; such files are not cached
+            return
+        write_atomic(entry_path, _MAGIC + payload)
+
+
+__all__ = ["RawIndexCache"]
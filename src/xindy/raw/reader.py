@@ -2,12 +2,51 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import codecs
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from io import TextIOBase
+import mmap
+import os
 from os import PathLike
 from pathlib import Path
+import re
+from typing import BinaryIO
 
-from xindy.dsl.sexpr import Keyword, Symbol, loads
+from xindy.dsl.sexpr import (
+    Keyword,
+    SExpr,
+    SExprSyntaxError,
+    Symbol,
+    loads,
+    unescape_string,
+)
+
+
+_CHUNK_SIZE = 1 << 16
+# Below this many characters per worker, process start-up outweighs the parse.
+_MIN_PARALLEL_CHUNK = 1 << 20
+_STRUCTURE_RE = re.compile(r'[()";]|#\|')
+_LITERAL = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING_RE = re.compile(_LITERAL, re.DOTALL)
+_STRING_BODY_RE = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"', re.DOTALL)
+# The shape emitted by tex2xindy and the LaTeX packages, optionally preceded by
+# whitespace and line comments. Anything else goes through the generic parser.
+_CANONICAL_ENTRY_RE = re.compile(
+    r"\s*(?:;[^\n]*(?:\n|\Z)\s*)*"
+    rf"\(\s*indexentry\s+:key\s*\(\s*(?P<key>{_LITERAL}(?:\s*{_LITERAL})*)\s*\)"
+    rf"(?:\s*:attr\s*(?P<attr>{_LITERAL}))?"
+    rf"(?:\s*:locref\s*(?P<locref>{_LITERAL}))?"
+    rf"(?:\s*:attr\s*(?P<late_attr>{_LITERAL}))?"
+    r"\s*\)",
+    re.DOTALL,
+)
+_BLOCK_DELIMITER_RE = re.compile(r"#\||\|#")
+# Byte-level twins used by load_raw_index_mmap; only ASCII structure is matched.
+_CANONICAL_ENTRY_BYTES_RE = re.compile(_CANONICAL_ENTRY_RE.pattern.encode(), re.DOTALL)
+# initial size in bytes of the window decoded for a non-canonical form
+_FORM_WINDOW = 256
 
 
 class RawIndexSyntaxError(ValueError):
@@ -25,19 +64,325 @@ class RawIndexEntry:
     extras: Mapping[str, object] = field(default_factory=dict)
 
 
-def parse_raw_index(text: str) -> list[RawIndexEntry]:
-    """Parse the contents of a raw index file provided as a string."""
-    forms = loads(text)
-    return [_entry_from_form(form) for form in forms]
+def parse_raw_index(text: str, *, workers: int | None = None) -> list[RawIndexEntry]:
+    """Parse the contents of a raw index file provided as a string.
+
+    With ``workers`` greater than one, large inputs are cut at top-level form
+    boundaries and the pieces are parsed in a process pool. Entries are returned
+    in input order either way, so positions assigned downstream are unchanged.
+    """
+    pieces = _split_for_workers(text, workers) if workers and workers > 1 else [text]
+    if len(pieces) < 2:
+        return _parse_entries(text)
+    try:
+        with ProcessPoolExecutor(max_workers=len(pieces)) as pool:
+            chunks = list(pool.map(_parse_piece, pieces))
+    except (SExprSyntaxError, RawIndexSyntaxError):
+        # A cut inside a string, comment or list always leaves the piece before it
+        # unterminated; the serial parse is authoritative (and reports real lines).
+        return _parse_entries(text)
+    return [RawIndexEntry(*fields) for chunk in chunks for fields in chunk]
 
 
-def load_raw_index(path: str | PathLike[str]) -> list[RawIndexEntry]:
-    """Read ``path`` and parse every index entry."""
+def load_raw_index(
+    path: str | PathLike[str],
+    *,
+    workers: int | None = None,
+) -> list[RawIndexEntry]:
+    """Read ``path`` and parse every index entry (see :func:`parse_raw_index`)."""
     try:
         content = Path(path).read_text(encoding="utf-8")
     except UnicodeDecodeError:
         content = Path(path).read_text(encoding="latin-1")
-    return parse_raw_index(content)
+    return parse_raw_index(content, workers=workers)
+
+
+def load_raw_index_mmap(path: str | PathLike[str]) -> list[RawIndexEntry]:
+    """Parse ``path`` through a memory map without decoding the whole file.
+
+    Canonical records are matched on the raw bytes and only their string literals
+    are decoded, as UTF-8 with a per-record latin-1 fallback. Other forms are
+    decoded one at a time and handed to the generic parser. On a syntax error the file is
+    re-read with :func:`load_raw_index` so the error reports the real location.
+    """
+    with open(path, "rb") as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            return []
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                return _parse_entries_bytes(data)
+            except SExprSyntaxError:
+                pass
+    return load_raw_index(path)
+
+
+def iter_raw_index(
+    source: str | PathLike[str] | BinaryIO | TextIOBase,
+    *,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[RawIndexEntry]:
+    """Yield index entries from ``source`` without reading it into memory at once.
+
+    ``source`` is a path or an open (text or binary) file object. The input is read
+    ``chunk_size`` characters at a time and only complete top-level forms are
+    handed to the parser, so memory stays bounded by the read buffer. Binary input
+    is decoded as UTF-8; once an invalid byte is seen the remainder is decoded as
+    latin-1, which matches :func:`load_raw_index` for the usual single-encoding files.
+    """
+    if isinstance(source, (str, PathLike)):
+        with open(source, "rb") as handle:
+            yield from _iter_entries(_read_chunks(handle, chunk_size))
+    else:
+        yield from _iter_entries(_read_chunks(source, chunk_size))
+
+
+def _parse_entries(text: str) -> list[RawIndexEntry]:
+    entries: list[RawIndexEntry] = []
+    match_canonical = _CANONICAL_ENTRY_RE.match
+    length = len(text)
+    pos = 0
+    while pos < length:
+        match = match_canonical(text, pos)
+        if match is not None:
+            entries.append(_entry_from_match(match))
+            pos = match.end()
+            continue
+        end = next(_FormBoundaries(pos).feed(text), length)
+        entries.extend(_entry_from_form(form) for form in loads(text[pos:end]))
+        pos = end
+    return entries
+
+
+def _parse_entries_bytes(data: mmap.mmap) -> list[RawIndexEntry]:
+    entries: list[RawIndexEntry] = []
+    match_canonical = _CANONICAL_ENTRY_BYTES_RE.match
+    length = len(data)
+    pos = 0
+    while pos < length:
+        match = match_canonical(data, pos)
+        if match is not None:
+            entries.append(_entry_from_bytes_match(match))
+            pos = match.end()
+            continue
+        forms, pos = _parse_next_form_bytes(data, pos)
+        entries.extend(_entry_from_form(form) for form in forms)
+    return entries
+
+
+def _parse_next_form_bytes(data: mmap.mmap, pos: int) -> tuple[list[SExpr], int]:
+    """Decode and parse the first top-level form at ``pos``; return it and the new offset.
+
+    The boundary is searched in a latin-1 view of a window that starts at
+    :data:`_FORM_WINDOW` bytes and doubles until it holds a complete form. In
+    that view character offsets are byte offsets and the structural characters
+    are ASCII, so the scanner resumes where it stopped and a form costs time
+    proportional to its own size. Only the bytes of the form itself are then
+    decoded, so its encoding does not depend on the records that follow it.
+    """
+    length = len(data)
+    size = _FORM_WINDOW
+    scanner = _FormBoundaries()
+    while True:
+        cut = data.find(b")", pos + size) if pos + size < length else -1
+        end = length if cut < 0 else cut + 1
+        boundary = next(scanner.feed(data[pos:end].decode("latin-1")), None)
+        if boundary is None and end < length:
+            size *= 2
+            continue
+        form_end = end if boundary is None else pos + boundary
+        text, _ = _decode_bytes(data[pos:form_end])
+        return loads(text), form_end
+
+
+def _entry_from_bytes_match(match: re.Match[bytes]) -> RawIndexEntry:
+    fields = match.group("key", "locref", "late_attr" if match.group("late_attr") else "attr")
+    try:
+        key_text, locref, attr = [None if raw is None else raw.decode("utf-8") for raw in fields]
+    except UnicodeDecodeError:
+        key_text, locref, attr = [None if raw is None else raw.decode("latin-1") for raw in fields]
+    key = _STRING_BODY_RE.findall(key_text)
+    if locref is not None:
+        locref = locref[1:-1]
+    if attr is not None:
+        attr = attr[1:-1]
+    if "\\" in key_text or (locref and "\\" in locref) or (attr and "\\" in attr):
+        key = [unescape_string(part) for part in key]
+        locref = None if locref is None else unescape_string(locref)
+        attr = None if attr is None else unescape_string(attr)
+    return RawIndexEntry(key=tuple(key), locref=locref, attr=attr, extras={})
+
+
+def _decode_bytes(raw: bytes) -> tuple[str, str]:
+    try:
+        return raw.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return raw.decode("latin-1"), "latin-1"
+
+
+def _split_for_workers(text: str, workers: int) -> list[str]:
+    """Cut ``text`` into roughly equal pieces at lines starting a new form.
+
+    The cuts are only candidates: a cut that is not a real top-level boundary makes
+    the preceding piece fail to parse, which :func:`parse_raw_index` detects.
+    """
+    parts = min(workers, len(text) // _MIN_PARALLEL_CHUNK)
+    if parts < 2:
+        return [text]
+    step = len(text) // parts
+    pieces: list[str] = []
+    start = 0
+    for _ in range(parts - 1):
+        cut = text.find("\n(", start + step)
+        if cut < 0:
+            break
+        pieces.append(text[start : cut + 1])
+        start = cut + 1
+    pieces.append(text[start:])
+    return pieces
+
+
+def _parse_piece(text: str) -> list[tuple[object, ...]]:
+    # Plain tuples pickle much faster than dataclass instances on the way back.
+    return [
+        (entry.key, entry.locref, entry.display_key, entry.attr, entry.extras)
+        for entry in _parse_entries(text)
+    ]
+
+
+def _iter_entries(chunks: Iterable[str]) -> Iterator[RawIndexEntry]:
+    for text in _split_forms(chunks):
+        yield from _parse_entries(text)
+
+
+def _read_chunks(handle: BinaryIO | TextIOBase, chunk_size: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    fallback = False
+    while True:
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            yield chunk
+            continue
+        if fallback:
+            yield chunk.decode("latin-1")
+            continue
+        buffered, _ = decoder.getstate()
+        try:
+            yield decoder.decode(chunk)
+        except UnicodeDecodeError:
+            fallback = True
+            yield (buffered + chunk).decode("latin-1")
+    if not fallback:
+        buffered, _ = decoder.getstate()
+        if buffered:
+            yield buffered.decode("latin-1")
+
+
+def _split_forms(chunks: Iterable[str]) -> Iterator[str]:
+    """Re-cut ``chunks`` so every yielded piece ends on a top-level form boundary.
+
+    Anything that cannot be completed (an unterminated list or string) is left to
+    the parser to report once the input is exhausted.
+    """
+    buffer = ""
+    scanner = _FormBoundaries()
+    for chunk in chunks:
+        buffer += chunk
+        boundary = max(scanner.feed(buffer), default=0)
+        if boundary:
+            yield buffer[:boundary]
+            buffer = buffer[boundary:]
+            scanner.scan -= boundary
+    if buffer and not buffer.isspace():
+        yield buffer
+
+
+class _FormBoundaries:
+    """Incremental scanner locating the ends of top-level forms.
+
+    Only parentheses, string literals and comments are inspected. The scan offset
+    and nesting depth persist between :meth:`feed` calls so a growing buffer is
+    never rescanned from the start.
+    """
+
+    def __init__(self, scan: int = 0):
+        self.scan = scan
+        self.depth = 0
+
+    def feed(self, buffer: str) -> Iterator[int]:
+        """Yield the offset just past every top-level form completed in ``buffer``."""
+        match_canonical = _CANONICAL_ENTRY_RE.match
+        while True:
+            if not self.depth:
+                canonical = match_canonical(buffer, self.scan)
+                if canonical is not None:
+                    self.scan = canonical.end()
+                    yield self.scan
+                    continue
+            match = _STRUCTURE_RE.search(buffer, self.scan)
+            if match is None:
+                # a trailing "#" may start a block comment completed by the next chunk
+                self.scan = max(self.scan, len(buffer) - 1)
+                return
+            token = match.group()
+            start = match.start()
+            if token == "(":
+                self.depth += 1
+                self.scan = start + 1
+            elif token == ")":
+                self.depth = max(self.depth - 1, 0)
+                self.scan = start + 1
+                if self.depth == 0:
+                    yield self.scan
+            elif token == '"':
+                literal = _STRING_RE.match(buffer, start)
+                if literal is None:
+                    self.scan = start
+                    return
+                self.scan = literal.end()
+            elif token == ";":
+                newline = buffer.find("\n", start)
+                if newline < 0:
+                    self.scan = start
+                    return
+                self.scan = newline + 1
+            elif start and not (buffer[start - 1].isspace() or buffer[start - 1] in "()\"'"):
+                # "#|" inside an atom is not a comment opener
+                self.scan = start + 2
+            else:
+                end = _skip_block_comment(buffer, start + 2)
+                if end is None:
+                    self.scan = start
+                    return
+                self.scan = end
+
+
+def _skip_block_comment(text: str, pos: int) -> int | None:
+    depth = 1
+    while depth:
+        delimiter = _BLOCK_DELIMITER_RE.search(text, pos)
+        if delimiter is None:
+            return None
+        depth += 1 if delimiter.group() == "#|" else -1
+        pos = delimiter.end()
+    return pos
+
+
+def _entry_from_match(match: re.Match[str]) -> RawIndexEntry:
+    """Build an entry straight from a :data:`_CANONICAL_ENTRY_RE` match."""
+    key_text, locref, attr, late_attr = match.group("key", "locref", "attr", "late_attr")
+    if late_attr is not None:
+        attr = late_attr
+    if "\\" in match.group():
+        key = tuple(unescape_string(part) for part in _STRING_BODY_RE.findall(key_text))
+        locref = None if locref is None else unescape_string(locref[1:-1])
+        attr = None if attr is None else unescape_string(attr[1:-1])
+    else:
+        key = tuple(_STRING_BODY_RE.findall(key_text))
+        locref = None if locref is None else locref[1:-1]
+        attr = None if attr is None else attr[1:-1]
+    return RawIndexEntry(key=key, locref=locref, attr=attr, extras={})
 
 
 def _entry_from_form(form: object) -> RawIndexEntry:
@@ -114,4 +459,11 @@ def _coerce_optional_string(value: object) -> str | None:
     return value
 
 
-__all__ = ["RawIndexEntry", "RawIndexSyntaxError", "load_raw_index", "parse_raw_index"]
+__all__ = [
+    "RawIndexEntry",
+    "RawIndexSyntaxError",
+    "iter_raw_index",
+    "load_raw_index",
+    "load_raw_index_mmap",
+    "parse_raw_index",
+]
@@ -395,6 +395,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             else:
                 out_path.write_text(output, encoding=args.output_encoding)
             logger.info(f"Processed {len(entries)} entries")
+            for line in index.diagnostics.summary():
+                logger.warn(line, mirror=False if args.q else None)
     except Exception as exc:  # pragma: no cover - defensive path
         if args.debug:
             traceback.print_exc()
@@ -37,3 +37,28 @@ def test_parse_one_detects_multiple_forms():
 def test_unterminated_list_raises():
     with pytest.raises(SExprSyntaxError):
         parse_one("(foo (bar)")
+
+
+def test_string_escapes_and_quote_forms():
+    exprs = loads('("a\\"b" "c\\\\d" "e\\nf" \'g \'(h))')
+    assert exprs == [
+        [
+            'a"b',
+            "c\\d",
+            "e\\nf",
+            [Symbol("quote"), Symbol("g")],
+            [Symbol("quote"), [Symbol("h")]],
+        ]
+    ]
+
+
+def test_nested_block_comments_and_atom_types():
+    exprs = loads("#| outer #| inner |# still outer |# (1 2.5 :kw sym)")
+    assert exprs == [[1, 2.5, Keyword("kw"), Symbol("sym")]]
+
+
+def test_syntax_errors_report_line_and_column():
+    with pytest.raises(SExprSyntaxError, match="Unexpected '\\)' at line 2, column 3"):
+        loads("(a)\n  )")
+    with pytest.raises(SExprSyntaxError, match="string literal at line 1, column 9"):
+        loads('(foo "ba')
@@ -0,0 +1,61 @@
+import pytest
+
+from xindy.dsl import build_snapshots, snapshots
+from xindy.dsl.interpreter import StyleInterpreter
+
+
+@pytest.fixture
+def snapshot_file(tmp_path, monkeypatch):
+    path = snapshots.write_module_snapshots(tmp_path / "snapshots.pickle")
+    monkeypatch.setattr(snapshots, "SNAPSHOT_PATH", path)
+    yield path
+    snapshots._load_snapshots.cache_clear()
+
+
+def test_require_uses_snapshot_forms(snapshot_file, monkeypatch):
+    expected = StyleInterpreter().load(snapshots.MODULES_DIR / "lang/german/din5007.xdy")
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("bundled modules should not be parsed")
+
+    monkeypatch.setattr("xindy.dsl.interpreter._parse_style_file", fail)
+    state = StyleInterpreter().load(snapshots.MODULES_DIR / "lang/german/din5007.xdy")
+
+    assert state.sort_rules == expected.sort_rules
+    assert state.loaded_files == expected.loaded_files
+
+
+def test_snapshot_is_ignored_when_source_differs(snapshot_file, tmp_path, monkeypatch):
+    modules = tmp_path / "modules"
+    (modules / "tex").mkdir(parents=True)
+    module = modules / "tex" / "example.xdy"
+    module.write_text('(define-letter-groups ("a"))')
+    monkeypatch.setattr(snapshots, "MODULES_DIR", modules)
+    snapshots.write_module_snapshots(snapshot_file, modules)
+    module.write_text('(define-letter-groups ("b"))')
+
+    assert snapshots.bundled_forms(module) is None
+    assert StyleInterpreter().load(module).letter_groups == ["b"]
+
+
+def test_verify_reports_stale_and_missing_modules(tmp_path):
+    modules = tmp_path / "modules"
+    modules.mkdir()
+    (modules / "a.xdy").write_text('(define-letter-groups ("a"))')
+    snapshot = snapshots.write_module_snapshots(tmp_path / "snapshots.pickle", modules)
+    assert snapshots.verify_module_snapshots(snapshot, modules) == []
+
+    (modules / "a.xdy").write_text('(define-letter-groups ("b"))')
+    (modules / "b.xdy").write_text("")
+    assert snapshots.verify_module_snapshots(snapshot, modules) == [
+        "a.xdy: source changed since the snapshot was built",
+        "b.xdy: missing from snapshot",
+    ]
+
+
+def test_check_mode_exit_status(tmp_path, capsys):
+    snapshot = tmp_path / "snapshots.pickle"
+    assert build_snapshots.main(["--check", "-o", str(snapshot)]) == 1
+    assert "missing" in capsys.readouterr().err
+    assert build_snapshots.main(["-o", str(snapshot)]) == 0
+    assert build_snapshots.main(["--check", "-o", str(snapshot)]) == 0
@@ -0,0 +1,97 @@
+from tests_paths import XINDY_TESTS_DIR as FIXTURES
+
+from xindy.dsl import (
+    StyleCache,
+    StyleInterpreter,
+    cache as cache_module,
+    interpreter as interpreter_module,
+)
+from xindy.locref import StandardLocationClass
+
+
+def test_cache_hit_skips_interpreter(tmp_path, monkeypatch):
+    style = FIXTURES / "deutsch.xdy"
+    cache = StyleCache(tmp_path / "cache")
+    expected = StyleInterpreter().load(style)
+    first = cache.load(style)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("style files should not be interpreted on a cache hit")
+
+    monkeypatch.setattr(interpreter_module.StyleInterpreter, "_eval_file", fail)
+    state = cache.load(style)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    for state_ in (first, state):
+        assert state_.loaded_files == expected.loaded_files
+        assert state_.sort_rules == expected.sort_rules
+        assert state_.letter_groups == expected.letter_groups
+        assert state_.location_classes.keys() == expected.location_classes.keys()
+    roman = state.basetypes["roman-numbers-lowercase"]
+    assert roman.match_func("xiv") == expected.basetypes["roman-numbers-lowercase"].match_func(
+        "xiv"
+    )
+
+
+def test_changed_module_invalidates_entry(tmp_path):
+    module = tmp_path / "letters.xdy"
+    module.write_text('(define-letter-groups ("a" "b"))')
+    style = tmp_path / "style.xdy"
+    style.write_text('(require "letters.xdy")')
+    cache = StyleCache(tmp_path / "cache")
+
+    assert cache.load(style, extra_search_paths=[tmp_path]).letter_groups == ["a", "b"]
+    module.write_text('(define-letter-groups ("x" "y"))')
+    assert cache.load(style, extra_search_paths=[tmp_path]).letter_groups == ["x", "y"]
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert len(list((tmp_path / "cache").glob("*.xdyc"))) == 1
+
+
+def test_search_paths_are_part_of_the_key(tmp_path):
+    style = tmp_path / "style.xdy"
+    style.write_text('(define-letter-groups ("a"))')
+    cache = StyleCache(tmp_path / "cache")
+    cache.load(style)
+    cache.load(style, extra_search_paths=[tmp_path])
+    cache.load(style)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    style = tmp_path / "style.xdy"
+    style.write_text('(define-letter-groups ("a"))')
+    cache = StyleCache(tmp_path / "cache")
+    cache.load(style)
+    for entry in (tmp_path / "cache").glob("*.xdyc"):
+        entry.write_bytes(cache_module._MAGIC + b" truncated")
+    assert cache.load(style).letter_groups == ["a"]
+    assert cache.misses == 2
+
+
+def test_package_sources_are_part_of_the_key(tmp_path, monkeypatch):
+    style = tmp_path / "style.xdy"
+    style.write_text('(define-letter-groups ("a"))')
+    cache = StyleCache(tmp_path / "cache")
+    cache.load(style)
+    monkeypatch.setattr(cache_module, "_package_digest", lambda: "other sources")
+    cache.load(style)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_entry_with_unset_fields_is_a_miss(tmp_path, monkeypatch):
+    style = tmp_path / "style.xdy"
+    style.write_text('(define-location-class "pages" ("arabic-numbers"))')
+    cache = StyleCache(tmp_path / "cache")
+
+    def older_layout(self):
+        # as if pickled before ``join_length`` was added
+        _, slots = object.__getstate__(self)
+        del slots["join_length"]
+        return None, slots
+
+    with monkeypatch.context() as patch:
+        patch.setattr(StandardLocationClass, "__getstate__", older_layout, raising=False)
+        cache.load(style)
+    state = cache.load(style)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert state.location_classes["pages"].join_length == 2
@@ -5,7 +5,7 @@ from tests_paths import XINDY_TESTS_DIR as TESTS_DIR
 
 from xindy.dsl.interpreter import StyleInterpreter
 from xindy.index import IndexBuilderError, build_index_entries
-from xindy.raw.reader import load_raw_index
+from xindy.raw.reader import RawIndexEntry, load_raw_index
 
 
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
@@ -85,3 +85,50 @@ def test_crossref_entries_are_collected():
     assert len(crossref_node.crossrefs) == 1
     assert crossref_node.crossrefs[0].target == ("target",)
     assert crossref_node.crossrefs[0].attribute == "verified"
+
+
+def test_aggregate_mode_folds_entries_into_same_index():
+    state = StyleInterpreter().load(DATA_DIR / "merge.xdy")
+    raw_entries = load_raw_index(DATA_DIR / "merge.raw") * 3
+    expected = build_index_entries(raw_entries, state)
+    index = build_index_entries(iter(raw_entries), state, aggregate=True)
+    assert index == expected
+    assert index.total_entries == expected.total_entries
+    assert index.groups[0].entry_count == expected.groups[0].entry_count
+
+
+def test_exact_duplicate_raw_entries_are_dropped():
+    state = StyleInterpreter().load(DATA_DIR / "crossref.xdy")
+    raw_entries = load_raw_index(DATA_DIR / "crossref.raw")
+    index = build_index_entries(raw_entries + raw_entries, state)
+    assert index.duplicates_dropped == len(raw_entries)
+    assert index.total_entries == build_index_entries(raw_entries, state).total_entries
+    crossref_node = next(node for node in index.groups[0].nodes if node.term == "see-target")
+    assert len(crossref_node.crossrefs) == 1
+
+
+def test_duplicated_input_is_counted_once():
+    state = StyleInterpreter().load(DATA_DIR / "crossref.xdy")
+    raw_entries = load_raw_index(DATA_DIR / "crossref.raw")
+    expected = build_index_entries(raw_entries, state)
+    for aggregate in (False, True):
+        index = build_index_entries(raw_entries * 3, state, aggregate=aggregate)
+        assert index.total_entries == expected.total_entries == len(raw_entries)
+        assert [group.entry_count for group in index.groups] == [
+            group.entry_count for group in expected.groups
+        ]
+
+
+def test_skipped_entries_are_counted_in_diagnostics():
+    state = StyleInterpreter().load(DATA_DIR / "simple.xdy")
+    raw_entries = [RawIndexEntry(key=(f"term{i}",), locref="@@") for i in range(5)]
+    raw_entries.append(RawIndexEntry(key=("nolocref",)))
+    index = build_index_entries(raw_entries, state)
+    diagnostics = index.diagnostics
+    assert diagnostics.counts == {"unmatched-locref": 5, "missing-locref": 1}
+    assert diagnostics.samples["unmatched-locref"] == ["term0 (@@)", "term1 (@@)", "term2 (@@)"]
+    assert diagnostics.total == 6
+    assert diagnostics.summary()[0] == (
+        "skipped 5 entries: no location class matches the location reference "
+        "(e.g. term0 (@@), term1 (@@), term2 (@@), ...)"
+    )
@@ -0,0 +1,29 @@
+import itertools
+
+from xindy.index.collation import encode_collation_key, first_sort_run, strip_position
+
+
+def test_byte_order_matches_tuple_order():
+    strings = ["", "a", "ab", "a\x00", "a\x00b", "b", "é", "\U0001f600"]
+    keys = [
+        (runs, display, position)
+        for runs in itertools.chain(
+            [()], ((s,) for s in strings), itertools.product(strings[:4], repeat=2)
+        )
+        for display in [(), ("a",), ("a", "")]
+        for position in (0, 1, 256)
+    ]
+    by_tuple = sorted(keys)
+    by_bytes = sorted(keys, key=lambda key: encode_collation_key(*key))
+    assert by_bytes == by_tuple
+
+
+def test_first_sort_run_is_decoded_back():
+    assert first_sort_run(encode_collation_key(["a\x00é", "b"], ["x"], 3)) == "a\x00é"
+    assert first_sort_run(encode_collation_key([], ["x"], 3)) == ""
+
+
+def test_strip_position_ignores_only_the_position():
+    key = strip_position(encode_collation_key(["a"], ["A"], 1))
+    assert key == strip_position(encode_collation_key(["a"], ["A"], 2**40))
+    assert key != strip_position(encode_collation_key(["a"], ["a"], 1))
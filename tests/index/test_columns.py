@@ -0,0 +1,75 @@
+from array import array
+
+from xindy.index.columns import CLOSE_RANGE, NORMAL, OPEN_RANGE, LocrefColumns
+from xindy.index.models import IndexNode
+from xindy.locref import LayeredLocationReference, make_category_attribute
+
+
+def _ref(
+    locref: str,
+    ordnums: tuple = (),
+    *,
+    attribute: str = "default",
+    layers: tuple[str, ...] | None = None,
+    state: str = "normal",
+) -> LayeredLocationReference:
+    return LayeredLocationReference(
+        locclass=None,
+        attribute=attribute,
+        layers=layers if layers is not None else (locref,),
+        locref_string=locref,
+        ordnums=ordnums,
+        catattr=make_category_attribute(attribute),
+        state=state,
+    )
+
+
+def test_columns_store_integer_ordnums_in_arrays():
+    refs = [
+        _ref("3", (3,)),
+        _ref("2-7", (2, 7), attribute="def", layers=("2", "7"), state="open-range"),
+        _ref("9", (9,), state="close-range"),
+    ]
+    columns = LocrefColumns(refs)
+    assert isinstance(columns.ordnums, array)
+    assert list(columns.ordnums) == [3, 7, 9]
+    assert list(columns.first_ordnums) == [3, 2, 9]
+    assert [columns.attribute_names[code] for code in columns.attributes] == [
+        "default",
+        "def",
+        "default",
+    ]
+    assert list(columns.states) == [NORMAL, OPEN_RANGE, CLOSE_RANGE]
+    assert columns.prefixes == [(), ("2",), ()]
+
+
+def test_columns_fall_back_to_the_location_string():
+    refs = [_ref("12"), _ref("xii", ("x",)), _ref("iv")]
+    columns = LocrefColumns(refs)
+    assert [columns.ordnum(idx) for idx in range(3)] == [12, None, None]
+    assert list(columns.has_first_ordnum) == [0, 0, 0]
+
+
+def test_columns_keep_numbers_beyond_64_bits():
+    refs = [_ref("1", (1,)), _ref("big", (2**70,))]
+    columns = LocrefColumns(refs)
+    assert columns.ordnum(1) == 2**70
+
+
+def test_set_state_updates_reference_and_row():
+    ref = _ref("4", (4,), state="open-range")
+    columns = LocrefColumns([ref])
+    columns.set_state(0, "normal")
+    assert ref.state == "normal"
+    assert columns.states[0] == NORMAL
+
+
+def test_node_columns_follow_locref_changes():
+    node = IndexNode(term="t", key=("t",))
+    node.add_locrefs([_ref("1", (1,))])
+    columns = node.locref_columns()
+    assert node.locref_columns() is columns
+    node.add_locrefs([_ref("2", (2,))])
+    assert list(node.locref_columns().ordnums) == [1, 2]
+    node.set_locrefs([_ref("5", (5,))])
+    assert list(node.locref_columns().ordnums) == [5]
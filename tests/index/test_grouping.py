@@ -2,8 +2,9 @@ from pathlib import Path
 
 from tests_paths import XINDY_TESTS_DIR as TESTS_DIR
 
-from xindy.dsl.interpreter import StyleInterpreter
+from xindy.dsl.interpreter import StyleInterpreter, StyleState
 from xindy.index.builder import build_index_entries
+from xindy.index.grouping import LetterGroupClassifier, letter_group_classifier
 from xindy.raw.reader import load_raw_index
 
 
@@ -48,3 +49,21 @@ def test_group_entries_falls_back_to_alphabet():
     groups = index.groups
     assert groups[0].label.lower().startswith("a")
     assert groups[0].nodes[0].term == "a"
+
+
+def test_letter_group_classifier_prefers_longest_then_first_label():
+    classifier = LetterGroupClassifier(["a", "b", "ch", "c", "A", "Ch"])
+    assert classifier.classify("chaos") == "ch"
+    assert classifier.classify("cello") == "c"
+    assert classifier.classify("Apple") == "a"
+    assert classifier.classify("--bee") == "b"
+    assert classifier.classify("zebra") == "a"
+    assert LetterGroupClassifier([]).classify("x") == "#"
+
+
+def test_letter_group_classifier_is_rebuilt_when_groups_change():
+    state = StyleState(letter_groups=["a", "b"])
+    classifier = letter_group_classifier(state)
+    assert letter_group_classifier(state) is classifier
+    state.letter_groups = ["a", "b", "bb"]
+    assert letter_group_classifier(state).classify("bbq") == "bb"
@@ -0,0 +1,72 @@
+from xindy.index import models
+from xindy.index.hierarchy import build_hierarchy
+from xindy.index.models import IndexEntry, IndexNode
+from xindy.locref import LayeredLocationReference, make_category_attribute
+
+
+def _entry(*key: str) -> IndexEntry:
+    return IndexEntry(key=key, display_key=key, canonical_key=key, attribute=None)
+
+
+def test_build_hierarchy_keeps_first_seen_order_of_children():
+    entries = [_entry("b"), _entry("a", "y"), _entry("b", "x"), _entry("a"), _entry("a", "x")]
+    roots = build_hierarchy(entries, enable_ranges=False)
+    assert [node.term for node in roots] == ["b", "a"]
+    assert [child.key for child in roots[1].children] == [("a", "y"), ("a", "x")]
+
+
+def test_find_child_follows_direct_edits_of_children():
+    node = IndexNode(term="t", key=("t",))
+    first = IndexNode(term="a", key=("t", "a"))
+    node.add_child(first)
+    assert node.find_child(("t", "a")) is first
+    second = IndexNode(term="b", key=("t", "b"))
+    node.children.append(second)
+    assert node.find_child(("t", "b")) is second
+    node.children.remove(first)
+    assert node.find_child(("t", "a")) is None
+
+
+def _ref(page: str) -> LayeredLocationReference:
+    return LayeredLocationReference(
+        locclass=None,
+        attribute="default",
+        layers=(page,),
+        locref_string=page,
+        ordnums=(int(page),),
+        catattr=make_category_attribute("default"),
+    )
+
+
+def test_add_locrefs_drops_duplicates_across_calls_and_replacements():
+    node = IndexNode(term="t", key=("t",))
+    assert node.add_locrefs([_ref("1"), _ref("2")])
+    assert not node.add_locrefs([_ref("2")])
+    node.set_locrefs([node.locrefs[0]])
+    assert node.add_locrefs([_ref("2")])
+    node.locrefs.append(_ref("3"))
+    assert not node.add_locrefs([_ref("3")])
+    assert [ref.locref_string for ref in node.locrefs] == ["1", "2", "3"]
+
+
+def test_heavily_referenced_term_signs_each_locref_once(monkeypatch):
+    # stands in for a timing benchmark: the work must grow linearly with the
+    # number of pages, where rebuilding the signatures per call was quadratic
+    calls = 0
+    signature = models._locref_signature
+
+    def counting(ref):
+        nonlocal calls
+        calls += 1
+        return signature(ref)
+
+    monkeypatch.setattr(models, "_locref_signature", counting)
+    pages = 5000
+    entries = []
+    for page in range(1, pages + 1):
+        entry = _entry("term")
+        entry.locrefs.append(_ref(str(page)))
+        entries.append(entry)
+    roots = build_hierarchy(entries, enable_ranges=False)
+    assert len(roots[0].locrefs) == pages
+    assert calls == pages
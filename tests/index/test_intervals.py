@@ -0,0 +1,22 @@
+from xindy.index import IntervalSet
+
+
+def test_intervals_merge_overlapping_and_adjacent_ranges():
+    covered = IntervalSet()
+    assert not covered
+    covered.add(10, 20)
+    covered.add(30, 25)
+    covered.add(21, 24)
+    covered.add(40, 40)
+    assert list(covered) == [(10, 30), (40, 40)]
+    covered.add(1, 100)
+    assert list(covered) == [(1, 100)]
+
+
+def test_interval_membership():
+    covered = IntervalSet()
+    covered.add(1, 2000)
+    covered.add(3000, 3001)
+    assert 1 in covered and 2000 in covered and 3001 in covered
+    assert 0 not in covered and 2001 not in covered and 2999 not in covered
+    assert "5" not in covered
@@ -0,0 +1,91 @@
+import pickle
+
+from xindy.dsl.interpreter import StyleState
+from xindy.index.collation import encode_collation_key
+from xindy.index.models import IndexEntry
+from xindy.index.order import (
+    apply_merge_rules,
+    apply_sort_rules,
+    entry_sort_key,
+    rule_pipeline,
+    sort_entries,
+    sort_key_cache,
+)
+
+
+def test_pipeline_is_built_once_per_state():
+    state = StyleState(sort_rules=[("a", "b", False, 0)])
+    pipeline = rule_pipeline(state)
+    assert rule_pipeline(state) is pipeline
+    assert apply_sort_rules("aa", state) == ("bb",)
+
+
+def test_pipeline_is_rebuilt_when_rules_are_added():
+    state = StyleState(sort_rules=[("a", "b", False, 0)])
+    assert apply_sort_rules("ac", state) == ("bc",)
+    state.sort_rules.append(("c", "d", False, 1))
+    assert apply_sort_rules("ac", state) == ("bc", "ad")
+
+
+def test_sort_runs_follow_orientation():
+    state = StyleState(
+        sort_rules=[("x", "y", False, 0), ("^x", "", False, 1)],
+        sort_rule_orientations=["forward", "backward"],
+    )
+    assert apply_sort_rules("abx", state) == ("aby", "ba")
+
+
+def test_merge_rules_apply_longest_pattern_first_and_repeat():
+    state = StyleState(
+        keyword_merge_rules=[
+            ("a", "b", False, 0),
+            ("aa", "c", False, 0),
+            ("cc", "c", True, 1),
+            ("(", "", False, 1),
+        ]
+    )
+    assert apply_merge_rules("aaaaaaa", state) == "cb"
+
+
+def test_sort_key_cache_counts_hits_and_is_bounded():
+    state = StyleState(sort_rules=[("a", "b", False, 0)], sort_key_cache_size=2)
+    memo = sort_key_cache(state)
+    assert memo.key("aa") == ("bb",)
+    assert memo.key("aa") == ("bb",)
+    assert (memo.hits, memo.misses) == (2, 2)
+    for part in ("x", "y", "aa"):
+        memo.key(part)
+    assert memo.merge.cache_info().currsize == 2
+    assert memo.misses == 8
+
+
+def test_sort_key_cache_is_shared_and_reset_with_the_pipeline():
+    state = StyleState(sort_rules=[("a", "b", False, 0)])
+    memo = sort_key_cache(state)
+    assert sort_key_cache(state) is memo
+    state.sort_rules.append(("b", "c", False, 0))
+    assert sort_key_cache(state) is not memo
+    assert sort_key_cache(state).key("a") == ("c",)
+
+
+def test_state_with_sort_key_cache_can_be_pickled():
+    state = StyleState(sort_rules=[("a", "b", False, 0)], sort_key_cache_size=8)
+    sort_key_cache(state).key("aa")
+    restored = pickle.loads(pickle.dumps(state))
+    memo = sort_key_cache(restored)
+    assert memo is restored.sort_key_cache
+    assert (memo.maxsize, memo.misses) == (8, 0)
+    assert memo.key("aa") == ("bb",)
+
+
+def test_sort_entries_reads_the_precomputed_sort_key():
+    state = StyleState(sort_rules=[("a", "z", False, 0)])
+    first = IndexEntry(key=("b",), display_key=("b",), canonical_key=("b",), attribute=None)
+    second = IndexEntry(
+        key=("a",), display_key=("A",), canonical_key=("a",), attribute=None, position=1
+    )
+    assert entry_sort_key(second, sort_key_cache(state)) == encode_collation_key(["z"], ["a"], 1)
+    assert sort_entries([second, first], state) == [first, second]
+    # a stored key wins over the rules
+    second.sort_key = encode_collation_key(["a"], ["a"], 1)
+    assert sort_entries([first, second], state) == [second, first]
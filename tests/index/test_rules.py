@@ -0,0 +1,37 @@
+from xindy.index.rules import LiteralBatch, RegexRule, apply_steps, compile_rules
+
+
+def test_single_character_literals_share_one_translate_batch():
+    steps = compile_rules([("ä", "a", False), ("ö", "o", False), ("\\.", "", False)])
+    assert len(steps) == 1
+    assert isinstance(steps[0], LiteralBatch)
+    assert steps[0].table is not None
+    assert apply_steps("ä.ö", steps) == "ao"
+
+
+def test_multi_character_literals_use_one_alternation():
+    steps = compile_rules([("ae", "a", False), ("oe", "o", False)])
+    assert len(steps) == 1
+    assert steps[0].pattern is not None
+    assert apply_steps("aeoe", steps) == "ao"
+
+
+def test_dependent_literals_start_a_new_batch():
+    # the second rule rewrites the output of the first one
+    steps = compile_rules([("ß", "ss", False), ("s", "z", False)])
+    assert len(steps) == 2
+    assert apply_steps("ßs", steps) == "zzz"
+
+
+def test_overlapping_literals_start_a_new_batch():
+    steps = compile_rules([("ab", "x", False), ("bc", "y", False)])
+    assert len(steps) == 2
+    assert apply_steps("abc", steps) == "xc"
+
+
+def test_regex_and_non_terminating_repeat_rules_keep_their_own_step():
+    steps = compile_rules(
+        [("a", "b", False), ("^b+", "", False), ("cc", "c", True), ("[", "", False)]
+    )
+    assert [type(step) for step in steps] == [LiteralBatch, RegexRule, RegexRule]
+    assert apply_steps("aacccc", steps) == "c"
@@ -1,6 +1,13 @@
+from functools import partial
+
+import pytest
+
 from xindy.locref import (
     Alphabet,
     Enumeration,
+    LocationClassDispatch,
+    LocationMatchCache,
+    LocationMatchError,
     LocClassLayer,
     LocClassSeparator,
     build_location_reference,
@@ -11,7 +18,10 @@ from xindy.locref import (
     make_category_attribute,
     perform_match,
     prefix_match_for_radix_numbers,
+    prefix_match_for_roman_numbers,
 )
+from xindy.locref.basetypes import roman_numeral_table
+from xindy.locref.classes import compile_location_class
 
 
 def make_digit_enumeration() -> Enumeration:
@@ -73,3 +83,109 @@ def test_locref_comparisons():
     assert locref_class_eq(ref_a, ref_b)
     assert not locref_class_lt(ref_a, ref_b)
     assert locref_ordnum_lt(ref_a.ordnums, ref_b.ordnums)
+
+
+def test_location_match_cache_remembers_matches_and_misses():
+    digits = make_digit_enumeration()
+    loccls = checked_make_standard_location_class("page", [LocClassLayer(digits)], join_length=2)
+    category = make_category_attribute("default")
+    cache = LocationMatchCache()
+    first = build_location_reference(loccls, "12", category, None, cache)
+    second = build_location_reference(loccls, "12", category, None, cache)
+    assert first is not second
+    assert second.ordnums == (12,)
+    assert build_location_reference(loccls, "AB", category, None, cache) is None
+    assert cache.match("AB", loccls) is None
+    assert len(cache) == 2
+
+
+def test_layered_classes_compile_to_one_regex():
+    roman = Enumeration(
+        name="roman-numbers-lowercase",
+        match_func=partial(prefix_match_for_roman_numbers, lowercase=True),
+    )
+    layers = [
+        LocClassLayer(Alphabet(name="parts", symbols=("A", "B", "App"))),
+        LocClassSeparator("-"),
+        LocClassLayer(roman),
+        LocClassSeparator("."),
+        LocClassLayer(
+            Enumeration(name="hex", match_func=partial(prefix_match_for_radix_numbers, radix=16))
+        ),
+    ]
+    loccls = checked_make_standard_location_class("appendix", layers, join_length=2)
+    assert compile_location_class(loccls) is not None
+    assert perform_match("Ap-xiv.1f", loccls) == (["Ap", "xiv", "1f"], [2, 14, 31])
+    with pytest.raises(LocationMatchError):
+        perform_match("A-iiii.1", loccls)
+
+
+def test_custom_matchers_fall_back_to_layer_walk():
+    # digits only matched up to the separator, as prefix_match would
+    digits = make_digit_enumeration()
+    loccls = checked_make_standard_location_class(
+        "page", [LocClassLayer(digits), LocClassSeparator("1")], join_length=2
+    )
+    assert compile_location_class(loccls) is None
+    with pytest.raises(LocationMatchError):
+        perform_match("111", loccls)
+
+
+def test_dispatch_keeps_only_classes_that_can_start_with_the_character():
+    arabic = checked_make_standard_location_class(
+        "arabic-page-numbers",
+        [
+            LocClassLayer(
+                Enumeration(
+                    name="arabic-numbers",
+                    match_func=partial(prefix_match_for_radix_numbers, radix=10),
+                )
+            )
+        ],
+        join_length=2,
+    )
+    roman = checked_make_standard_location_class(
+        "roman-page-numbers",
+        [
+            LocClassLayer(
+                Enumeration(
+                    name="roman-numbers-lowercase",
+                    match_func=partial(prefix_match_for_roman_numbers, lowercase=True),
+                )
+            )
+        ],
+        join_length=2,
+    )
+    alpha = checked_make_standard_location_class(
+        "alpha-page-numbers",
+        [LocClassLayer(Alphabet(name="alpha", symbols=tuple("abcdefghijklmnopqrstuvwxyz")))],
+        join_length=2,
+    )
+    dispatch = LocationClassDispatch([arabic, roman, alpha])
+    assert dispatch.candidates("12") == (arabic,)
+    assert dispatch.candidates("xiv") == (roman, alpha)
+    assert dispatch.candidates("XIV") == (roman,)
+    assert dispatch.candidates("b") == (alpha,)
+    assert dispatch.candidates("٣") == (arabic, roman, alpha)
+    custom = checked_make_standard_location_class(
+        "custom", [LocClassLayer(make_digit_enumeration())], join_length=2
+    )
+    assert LocationClassDispatch([custom, alpha]).candidates("b") == (custom, alpha)
+
+
+def test_roman_numeral_table_and_matchers():
+    table = roman_numeral_table()
+    assert table["xiv"] == 14 and table["mmmmcmxcix"] == 4999
+    assert len(table) == 4999
+    assert prefix_match_for_roman_numbers("XIV", lowercase=True) == ("XIV", "", 14)
+    assert prefix_match_for_roman_numbers("ivi", lowercase=True) == ("iv", "i", 4)
+    assert prefix_match_for_radix_numbers("ff-1", 16) == ("ff", "-1", 255)
+    assert prefix_match_for_radix_numbers("1٣x", 10) == ("1٣", "x", 13)
+
+
+def test_alphabet_matches_partial_symbol_prefixes():
+    alph = Alphabet(name="parts", symbols=("App", "Bib", "Ap"))
+    result = alph.prefix_match("Ax")
+    assert (result.matched, result.rest, result.ordnum) == ("A", "x", 0)
+    assert alph.prefix_match("Bi1").ordnum == 1
+    assert alph.prefix_match("C") is None
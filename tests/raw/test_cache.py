@@ -0,0 +1,61 @@
+import os
+import time
+
+import pytest
+from tests_paths import XINDY_TESTS_DIR as FIXTURES
+
+from xindy.raw import RawIndexCache, cache as cache_module, load_raw_index
+
+
+def test_cache_hit_skips_parser(tmp_path, monkeypatch):
+    raw = tmp_path / "attr1.raw"
+    raw.write_bytes((FIXTURES / "attr1.raw").read_bytes())
+    cache = RawIndexCache(tmp_path / "cache")
+    expected = load_raw_index(raw)
+    assert cache.load(raw) == expected
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("parser should not run on a cache hit")
+
+    monkeypatch.setattr(cache_module, "parse_raw_index", fail)
+    os.utime(raw, (time.time() + 10, time.time() + 10))
+    assert cache.load(raw) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_content_misses(tmp_path):
+    raw = tmp_path / "index.raw"
+    raw.write_text('(indexentry :key ("a") :locref "1")')
+    cache = RawIndexCache(tmp_path / "cache")
+    cache.load(raw)
+    raw.write_text('(indexentry :key ("b") :locref "1")')
+    assert [entry.key for entry in cache.load(raw)] == [("b",)]
+    assert cache.misses == 2
+
+
+def test_unmarshallable_extras_are_not_cached(tmp_path):
+    raw = tmp_path / "index.raw"
+    raw.write_text('(indexentry :key ("a") :locref "1" :extra sym)')
+    cache = RawIndexCache(tmp_path / "cache")
+    assert cache.load(raw)[0].extras["extra"].name == "sym"
+    assert not list((tmp_path / "cache").glob("*.rawc"))
+
+
+@pytest.mark.parametrize("limit", ["age", "size"])
+def test_prune_applies_limits(tmp_path, limit):
+    cache_dir = tmp_path / "cache"
+    cache = RawIndexCache(cache_dir)
+    for idx in range(3):
+        raw = tmp_path / f"{idx}.raw"
+        raw.write_text(f'(indexentry :key ("k{idx}") :locref "{idx}")')
+        cache.load(raw)
+    stored = sorted(cache_dir.glob("*.rawc"))
+    assert len(stored) == 3
+    old = time.time() - 3600
+    os.utime(stored[0], (old, old))
+    if limit == "age":
+        cache.max_age = 60
+    else:
+        cache.max_bytes = sum(path.stat().st_size for path in stored[1:])
+    cache.prune()
+    assert sorted(cache_dir.glob("*.rawc")) == stored[1:]
@@ -1,7 +1,18 @@
+import io
+
 import pytest
 from tests_paths import XINDY_TESTS_DIR as FIXTURES
 
-from xindy.raw.reader import RawIndexSyntaxError, load_raw_index, parse_raw_index
+from xindy.dsl.sexpr import SExprSyntaxError, loads
+from xindy.raw import reader
+from xindy.raw.reader import (
+    RawIndexSyntaxError,
+    _entry_from_form,
+    iter_raw_index,
+    load_raw_index,
+    load_raw_index_mmap,
+    parse_raw_index,
+)
 
 
 def test_load_raw_index_reads_fixture():
@@ -36,3 +47,104 @@ def test_concatenated_keywords_are_split():
     entry = parse_raw_index(expr)[0]
     assert entry.attr == "bar"
     assert entry.extras["close-range"] is True
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_iter_raw_index_matches_load_raw_index(chunk_size):
+    expected = load_raw_index(FIXTURES / "attr1.raw")
+    assert list(iter_raw_index(FIXTURES / "attr1.raw", chunk_size=chunk_size)) == expected
+
+
+def test_iter_raw_index_reads_file_objects_across_chunk_boundaries():
+    text = (
+        "; comment with (paren\n"
+        "#| block #| nested |# |#\n"
+        '(indexentry :key ("a)b" "c\\"(") :locref "1")\n'
+        '(indexentry :key ("d") :locref "2")'
+    )
+    for chunk_size in range(1, 12):
+        entries = list(iter_raw_index(io.StringIO(text), chunk_size=chunk_size))
+        assert [entry.key for entry in entries] == [("a)b", 'c"('), ("d",)]
+
+
+def test_iter_raw_index_falls_back_to_latin1_bytes():
+    data = '(indexentry :key ("caf\xe9") :locref "1")'.encode("latin-1")
+    entry = next(iter_raw_index(io.BytesIO(data), chunk_size=3))
+    assert entry.key == ("caf\xe9",)
+
+
+def test_iter_raw_index_reports_truncated_forms():
+    with pytest.raises(SExprSyntaxError):
+        list(iter_raw_index(io.StringIO('(indexentry :key ("a")')))
+
+
+def test_canonical_records_match_generic_parser():
+    text = (
+        ";; header (not a form\n"
+        '(indexentry :key ("a" "b\\"c") :attr "x" :locref "12")\n'
+        '(indexentry :key("d"):locref"3":attr"y")\n'
+        '(indexentry :tkey (("e" "E")) :locref "4")\n'
+        '(indexentry :key ("f") :locref "5" :open-range)\n'
+        ';(indexentry :key ("ignored") :locref "6")'
+    )
+    expected = [_entry_from_form(form) for form in loads(text)]
+    assert parse_raw_index(text) == expected
+    assert [entry.key for entry in expected] == [("a", 'b"c'), ("d",), ("e",), ("f",)]
+
+
+def test_parallel_parse_preserves_order(monkeypatch):
+    monkeypatch.setattr(reader, "_MIN_PARALLEL_CHUNK", 64)
+    text = "".join(f'(indexentry :key ("k{idx}") :locref "{idx}")\n' for idx in range(40))
+    assert parse_raw_index(text, workers=3) == parse_raw_index(text)
+
+
+def test_parallel_parse_recovers_from_cut_inside_string(monkeypatch):
+    monkeypatch.setattr(reader, "_MIN_PARALLEL_CHUNK", 16)
+    text = '(indexentry :key ("a") :locref "1")\n(indexentry :key ("multi\n(line") :locref "2")'
+    pieces = reader._split_for_workers(text, 2)
+    assert pieces[0].endswith("multi\n")
+    entries = parse_raw_index(text, workers=2)
+    assert [entry.key for entry in entries] == [("a",), ("multi\n(line",)]
+
+
+def test_load_raw_index_mmap_matches_load_raw_index(tmp_path):
+    assert load_raw_index_mmap(FIXTURES / "ex1.raw") == load_raw_index(FIXTURES / "ex1.raw")
+    mixed = tmp_path / "mixed.raw"
+    mixed.write_bytes(
+        b'(indexentry :key ("caf\xe9") :locref "1")\n'
+        b'#| (skipped |# (indexentry :tkey (("b" "B")) :locref "2")\n'
+    )
+    entries = load_raw_index_mmap(mixed)
+    assert [entry.key for entry in entries] == [("caf\xe9",), ("b",)]
+    assert entries[1].display_key == ("B",)
+
+
+def test_load_raw_index_mmap_handles_forms_not_starting_lines(tmp_path):
+    single_line = tmp_path / "single.raw"
+    forms = [f'  (indexentry :tkey (("t{i} (x)" "T{i}")) :locref "{i}")' for i in range(300)]
+    single_line.write_text(" ".join(forms), encoding="utf-8")
+    entries = load_raw_index_mmap(single_line)
+    assert entries == load_raw_index(single_line)
+    assert entries[-1].key == ("t299 (x)",)
+    assert entries[-1].display_key == ("T299",)
+
+
+def test_load_raw_index_mmap_decodes_each_form_on_its_own(tmp_path):
+    mixed = tmp_path / "mixed.raw"
+    mixed.write_bytes(
+        '(indexentry :tkey (("\xe9" "\xc9")) :locref "1")\n'.encode()
+        + b'(indexentry :key ("caf\xe9") :locref "2")\n'
+    )
+    entries = load_raw_index_mmap(mixed)
+    assert [entry.key for entry in entries] == [("\xe9",), ("caf\xe9",)]
+    assert entries[0].display_key == ("\xc9",)
+
+
+def test_load_raw_index_mmap_reports_errors_with_file_locations(tmp_path):
+    broken = tmp_path / "broken.raw"
+    broken.write_text('(indexentry :key ("a") :locref "1")\n(indexentry :key ("b")')
+    with pytest.raises(SExprSyntaxError, match="line 2"):
+        load_raw_index_mmap(broken)
+    empty = tmp_path / "empty.raw"
+    empty.write_text("")
+    assert load_raw_index_mmap(empty) == []
@@ -35,3 +35,57 @@ def test_cli_defaults_to_stdout_when_no_output(capsys):
     captured = capsys.readouterr()
     assert code == 0
     assert captured.out == expected
+
+
+def test_cli_jobs_option_matches_serial_output(tmp_path):
+    raw = DATA_DIR / "simple.raw"
+    style = DATA_DIR / "simple.xdy"
+    out_path = tmp_path / "out.ind"
+
+    code = cli.main(["-M", str(style), "-j", "2", "-o", str(out_path), str(raw)])
+
+    assert code == 0
+    assert out_path.read_text() == (DATA_DIR / "simple.ind").read_text()
+
+
+def test_cli_raw_cache_reuses_parsed_entries(tmp_path):
+    raw = DATA_DIR / "simple.raw"
+    style = DATA_DIR / "simple.xdy"
+    cache_dir = tmp_path / "cache"
+    expected = (DATA_DIR / "simple.ind").read_text()
+
+    for run in range(2):
+        out_path = tmp_path / f"out{run}.ind"
+        code = cli.main(
+            ["-M", str(style), "--raw-cache", str(cache_dir), "-o", str(out_path), str(raw)]
+        )
+        assert code == 0
+        assert out_path.read_text() == expected
+    assert len(list(cache_dir.glob("*.rawc"))) == 1
+
+
+def test_cli_style_cache_reuses_interpreted_style(tmp_path):
+    raw = DATA_DIR / "simple.raw"
+    style = DATA_DIR / "simple.xdy"
+    cache_dir = tmp_path / "cache"
+    expected = (DATA_DIR / "simple.ind").read_text()
+
+    for run in range(2):
+        out_path = tmp_path / f"out{run}.ind"
+        code = cli.main(
+            ["-M", str(style), "--style-cache", str(cache_dir), "-o", str(out_path), str(raw)]
+        )
+        assert code == 0
+        assert out_path.read_text() == expected
+    assert len(list(cache_dir.glob("*.xdyc"))) == 1
+
+
+def test_cli_aggregate_option_matches_default_output(tmp_path):
+    raw = DATA_DIR / "simple.raw"
+    style = DATA_DIR / "simple.xdy"
+    out_path = tmp_path / "out.ind"
+
+    code = cli.main(["-M", str(style), "--aggregate", "-o", str(out_path), str(raw)])
+
+    assert code == 0
+    assert out_path.read_text() == (DATA_DIR / "simple.ind").read_text()
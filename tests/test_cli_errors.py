@@ -33,3 +33,28 @@ def test_cli_reports_eval_error(tmp_path, capsys):
     assert code == 1
     assert "xindy error" in captured.err
     assert log.exists()
+
+
+def test_cli_reports_skipped_entries_summary(tmp_path, capsys):
+    raw = tmp_path / "bad.raw"
+    raw.write_text(
+        '(indexentry :key ("foo") :locref "1")\n(indexentry :key ("bar") :locref "@@")\n',
+        encoding="utf-8",
+    )
+
+    style = str(Path(__file__).parent / "data" / "simple.xdy")
+    warning = "warning: skipped 1 entry: no location class matches"
+
+    code = cli.main(["-M", style, "-V", "1", str(raw)])
+
+    captured = capsys.readouterr()
+    assert code == 0
+    assert "foo" in captured.out
+    assert captured.err.count(warning) == 1
+
+    log = tmp_path / "xindy.log"
+    code = cli.main(["-M", style, "-l", str(log), str(raw)])
+
+    assert code == 0
+    assert capsys.readouterr().err.count(warning) == 1
+    assert log.read_text(encoding="utf-8").count(warning) == 1
@@ -185,3 +185,19 @@ def test_makeindex4_cli_quiet_suppresses_style_warning(tmp_path, capsys):
     assert code == 0
     captured = capsys.readouterr()
     assert captured.err == ""
+
+
+def test_makeindex4_cli_logs_skipped_entries(tmp_path):
+    idx = tmp_path / "bad.idx"
+    idx.write_text("\\indexentry{alpha}{1}\n\\indexentry{beta}{@@}\n", encoding="latin-1")
+    out_path = tmp_path / "bad.ind"
+    log_path = tmp_path / "bad.ilg"
+
+    code = makeindex4_main([str(idx), "-o", str(out_path), "-t", str(log_path)])
+
+    assert code == 0
+    assert "beta" not in out_path.read_text()
+    assert log_path.read_text().splitlines()[1] == (
+        "warning: skipped 1 entry: no location class matches the location reference "
+        "(e.g. beta (@@))"
+    )